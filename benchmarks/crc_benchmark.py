@@ -0,0 +1,51 @@
+"""Microbenchmark for the MODBUS CRC implementations.
+
+Run from the repository root: python3 -m benchmarks.crc_benchmark
+"""
+
+import sys
+import timeit
+
+from custom_components.bluetti_bt.bluetti_bt_lib.utils import crc
+
+# Typical request frame and a large register read response
+SIZES = [6, 205]
+NUMBER = 20000
+
+
+def main():
+    candidates = {
+        "bundled (selected)": crc.modbus_crc,
+        "bundled 16 bit table": crc._crc_words,
+        "bundled 8 bit table": crc._crc_bytes,
+    }
+
+    try:
+        import crcmod.predefined
+
+        extension = sys.modules["crcmod.crcmod"]._usingExtension
+        name = "crcmod C extension" if extension else "crcmod pure python"
+        candidates[name] = crcmod.predefined.mkCrcFun("modbus")
+
+        # What crcmod falls back to on hosts without the C extension
+        from crcmod._crcfunpy import _crc16r
+
+        table = crc._BYTE_TABLE
+        candidates["crcmod pure python fallback"] = lambda data: _crc16r(
+            data, crc.MODBUS_CRC_INIT, table
+        )
+    except ImportError:
+        print("crcmod not installed, skipping comparison")
+
+    for size in SIZES:
+        data = bytes(range(256))[:size]
+        expected = crc._crc_bytes(data)
+        print(f"{size} bytes:")
+        for name, fun in candidates.items():
+            assert fun(data) == expected, name
+            seconds = timeit.timeit(lambda: fun(data), number=NUMBER)
+            print(f"  {name:<30} {seconds / NUMBER * 1e6:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Event loop blocking time of the encryption key exchange.
+
+Runs the key exchange through BluettiEncryption and the notification
+handler of DeviceReader. Compares the crypto done inline without the cached
+keys (as the notification handler did before), inline with the cached keys
+and the reader as it is now: keypair generated while waiting for the peer,
+signatures and ECDH in the executor. The executor only helps on hosts with
+more than one CPU core.
+
+The peer signs its pubkey with a key of its own instead of the key of a
+real device, verifying the signature costs the same. The time per handshake
+of the reader includes 5 ms for the round trip to the peer.
+
+Run from the repository root: python3 -m benchmarks.handshake_benchmark
+"""
+
+import asyncio
+import os
+import time
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from custom_components.bluetti_bt.bluetti_bt_lib.bluetooth import encryption
+from custom_components.bluetti_bt.bluetti_bt_lib.bluetooth.device_reader import (
+    DeviceReader,
+)
+from custom_components.bluetti_bt.bluetti_bt_lib.bluetooth.encryption import (
+    KEX_MAGIC,
+    BluettiEncryption,
+    Message,
+    hexsum,
+)
+
+HANDSHAKES = 200
+
+
+def kex_message(body: bytes) -> bytes:
+    return b"".join([KEX_MAGIC, body, hexsum(body, 2)])
+
+
+class Peer:
+    """Device side of the key exchange"""
+
+    def __init__(self):
+        self.signing_key = ec.generate_private_key(ec.SECP256R1())
+        self.verifying_key_der = self.signing_key.public_key().public_bytes(
+            serialization.Encoding.DER, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        self.encryption = BluettiEncryption()
+        self.challenge = kex_message(bytes([1, 4]) + os.urandom(4))
+        # Same keys as the local side derives from the challenge
+        self.encryption.msg_challenge(Message(self.challenge))
+
+        pubkey, _ = encryption.generate_keypair()
+        data = encryption.pubkey_to_bytes(pubkey)
+        signature = self.signing_key.sign(
+            data + self.encryption.unsecure_aes_iv, ec.ECDSA(hashes.SHA256())
+        )
+        body = bytes([4, 0x80]) + data + encryption.der_to_raw_ecdsa(signature)
+        self.peer_pubkey = self.encrypt(kex_message(body))
+        self.pubkey_accepted = self.encrypt(kex_message(bytes([6, 1, 0])))
+
+    def encrypt(self, message: bytes) -> bytes:
+        return bytes(
+            self.encryption.aes_encrypt(
+                message,
+                self.encryption.unsecure_aes_key,
+                self.encryption.unsecure_aes_iv,
+            )
+        )
+
+    def decrypt(self, frame: bytes) -> Message:
+        return Message(
+            self.encryption.aes_decrypt(
+                frame,
+                self.encryption.unsecure_aes_key,
+                self.encryption.unsecure_aes_iv,
+            )
+        )
+
+
+class Client:
+    """Connection which drops everything written"""
+
+    is_connected = True
+
+    async def write_gatt_char(self, uuid, data, response=None):
+        pass
+
+
+def use_peer_key(peer: Peer, cached: bool):
+    """Verify with the key of peer, parsed once or on every handshake like before"""
+    key = serialization.load_der_public_key(peer.verifying_key_der)
+    if cached:
+        encryption.peer_verifying_key = lambda: key
+    else:
+        encryption.peer_verifying_key = lambda: serialization.load_der_public_key(
+            peer.verifying_key_der
+        )
+
+
+def inline_handshake(peer: Peer, cached: bool):
+    """All steps of BluettiEncryption in the event loop"""
+    if not cached:
+        encryption.local_signing_key.cache_clear()
+    local = BluettiEncryption()
+    local.msg_challenge(Message(peer.challenge))
+    local.msg_peer_pubkey(peer.decrypt(peer.peer_pubkey))
+    local.msg_key_accepted(peer.decrypt(peer.pubkey_accepted))
+
+
+async def reader_handshake(reader: DeviceReader, peer: Peer):
+    """Steps as the notification handler of the reader does them"""
+    reader._reset_encryption()
+    await reader._notification_handler(0, bytearray(peer.challenge))
+    # The peer answers after a round trip, the keypair is generated meanwhile
+    await asyncio.sleep(0.005)
+    await reader._notification_handler(0, bytearray(peer.peer_pubkey))
+    await reader._notification_handler(0, bytearray(peer.pubkey_accepted))
+    assert reader.encryption_ready.is_set()
+
+
+async def blocked_time(handshake) -> tuple[float, float]:
+    """Total and longest time the event loop could not run other tasks"""
+    blocked = []
+    done = False
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            blocked.append(now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    for _ in range(HANDSHAKES):
+        await handshake()
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    done = True
+    await task
+
+    # Gaps below 0.1 ms are the ticker itself
+    lag = [b for b in blocked if b > 1e-4]
+    return elapsed, sum(lag), max(lag, default=0)
+
+
+async def main():
+    peer = Peer()
+    loop = asyncio.get_running_loop()
+    reader = DeviceReader(Client(), None, loop.create_future, encrypted=True)
+
+    async def uncached():
+        use_peer_key(peer, cached=False)
+        inline_handshake(peer, cached=False)
+
+    async def cached():
+        use_peer_key(peer, cached=True)
+        inline_handshake(peer, cached=True)
+
+    async def executor():
+        use_peer_key(peer, cached=True)
+        await reader_handshake(reader, peer)
+
+    for name, handshake in (
+        ("uncached", uncached),
+        ("cached", cached),
+        ("reader", executor),
+    ):
+        elapsed, blocked, longest = await blocked_time(handshake)
+        print(
+            f"{name:<10} {elapsed / HANDSHAKES * 1e3:6.2f} ms per handshake, "
+            f"loop blocked {blocked / HANDSHAKES * 1e3:6.2f} ms "
+            f"(longest {longest * 1e3:.2f} ms)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
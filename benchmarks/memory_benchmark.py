@@ -0,0 +1,148 @@
+"""Memory footprint of the device models.
+
+The baseline is measured with copies of the slotted classes compiled
+without __slots__, so it follows changes of the field tables.
+
+Run from the repository root: python3 -m benchmarks.memory_benchmark
+"""
+
+import ast
+from contextlib import contextmanager
+import gc
+import importlib
+import inspect
+import sys
+import tracemalloc
+import types
+
+from custom_components.bluetti_bt.bluetti_bt_lib.field_attributes import (
+    FIELD_ATTRIBUTES,
+    PACK_FIELD_ATTRIBUTES,
+)
+from custom_components.bluetti_bt.bluetti_bt_lib.utils.device_builder import (
+    DEVICE_CLASSES,
+    build_device,
+    get_device_class,
+)
+
+MODELS = ["AC180P", "AC300", "EP600", "EP760"]
+
+PACKAGE = "custom_components.bluetti_bt.bluetti_bt_lib"
+# Modules with the slotted classes a device model is built from
+SLOTTED_MODULES = ["utils.struct", "utils.commands", "field_attributes"]
+
+
+class RemoveSlots(ast.NodeTransformer):
+    def visit_ClassDef(self, node: ast.ClassDef):
+        node.body = [
+            n
+            for n in node.body
+            if not (
+                isinstance(n, ast.Assign)
+                and any(isinstance(t, ast.Name) and t.id == "__slots__" for t in n.targets)
+            )
+        ] or [ast.Pass()]
+        return node
+
+
+def compile_without_slots(module: types.ModuleType) -> types.ModuleType:
+    """Copy of module with all __slots__ declarations removed"""
+    tree = RemoveSlots().visit(ast.parse(inspect.getsource(module)))
+    copy = types.ModuleType(module.__name__)
+    copy.__package__ = module.__package__
+    copy.__file__ = module.__file__
+    exec(compile(tree, module.__file__, "exec"), vars(copy))
+    return copy
+
+
+@contextmanager
+def without_slots():
+    """Use the copies without __slots__ in all modules of the integration"""
+    replacements = {}
+    copies = []
+    for name in SLOTTED_MODULES:
+        module = importlib.import_module(f"{PACKAGE}.{name}")
+        copy = compile_without_slots(module)
+        copies.append(copy)
+        for attr, value in vars(module).items():
+            if isinstance(value, type) and "__slots__" in vars(value):
+                replacements[value] = vars(copy)[attr]
+
+    def replace(value):
+        if isinstance(value, type):
+            return replacements.get(value, value)
+        if isinstance(value, tuple) and all(isinstance(v, type) for v in value):
+            return tuple(replacements.get(v, v) for v in value)
+        return value
+
+    modules = [m for n, m in sys.modules.items() if n.startswith(PACKAGE)] + copies
+    patched = []
+    for module in modules:
+        for attr, value in list(vars(module).items()):
+            new = replace(value)
+            if new is not value and new != value:
+                patched.append((module, attr, value))
+                setattr(module, attr, new)
+    try:
+        yield
+    finally:
+        for module, attr, value in patched:
+            setattr(module, attr, value)
+
+
+def measure(fun) -> int:
+    """Bytes still allocated by the objects fun returns"""
+    gc.collect()
+    tracemalloc.start()
+    result = fun()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def build(model: str):
+    device = build_device("aa:bb:cc:dd:ee:ff", f"{model}1")
+    commands = device.polling_commands + device.pack_polling_commands
+    return device, commands
+
+
+def measure_all() -> dict:
+    """Sizes of the device models and of the pack field attributes"""
+    sizes = {}
+    for model in MODELS:
+        # Allocations of the first build of a model aren't counted
+        build(model)
+        sizes[model] = measure(lambda: build(model))
+    sizes["packs"] = measure(lambda: [PACK_FIELD_ATTRIBUTES(p) for p in range(1, 7)])
+    return sizes
+
+
+def main():
+    # Import all device modules before measuring
+    for model in DEVICE_CLASSES:
+        get_device_class(model)
+
+    sizes = measure_all()
+    # Instances without __slots__ get smaller the more of them were built
+    # before, both runs measure in the same order
+    with without_slots():
+        baseline = measure_all()
+
+    def compare(name: str) -> str:
+        kib = sizes[name] / 1024
+        before = baseline[name] / 1024
+        return f"{kib:8.1f} KiB (without __slots__ {before:5.1f} KiB, {(kib - before) / before:+6.1%})"
+
+    for model in MODELS:
+        device, commands = build(model)
+        print(
+            f"{model:<8} {len(device.struct.fields):4} fields {len(commands):3} commands"
+            f" {compare(model)}"
+        )
+
+    print(f"FIELD_ATTRIBUTES {len(FIELD_ATTRIBUTES)}, 6 packs {compare('packs')}")
+
+
+if __name__ == "__main__":
+    main()
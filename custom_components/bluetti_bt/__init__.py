@@ -14,18 +14,27 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import (
+    CONF_DATA_TTL,
     CONF_ENCRYPTION,
+    CONF_LINGER_TIME,
+    CONF_MAX_POLLING_INTERVAL,
     CONF_MAX_RETRIES,
+    CONF_PACK_POLLING_INTERVAL,
     CONF_PERSISTENT_CONN,
+    CONF_PIPELINED,
     CONF_POLLING_INTERVAL,
     CONF_POLLING_TIMEOUT,
+    CONF_SLOW_POLLING_INTERVAL,
     CONF_USE_CONTROLS,
     DATA_COORDINATOR,
     DATA_POLLING_RUNNING,
+    DATA_SCHEDULER,
     DOMAIN,
     MANUFACTURER,
 )
+from .bluetti_bt_lib.bluetooth.connection_scheduler import ConnectionScheduler
 from .bluetti_bt_lib.const import NOTIFY_UUID
+from .bluetti_bt_lib.utils.device_builder import get_device, remove_device
 from .coordinator import PollingCoordinator
 
 PLATFORMS: List[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
@@ -42,9 +51,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     use_controls = entry.data.get(CONF_USE_CONTROLS)
     polling_interval = entry.data.get(CONF_POLLING_INTERVAL, 60)
     persistent_conn = entry.data.get(CONF_PERSISTENT_CONN, False)
+    linger_time = entry.data.get(CONF_LINGER_TIME, 0)
     polling_timeout = entry.data.get(CONF_POLLING_TIMEOUT, 120)
     max_retries = entry.data.get(CONF_MAX_RETRIES, 5)
     use_encryption = entry.data.get(CONF_ENCRYPTION, False)
+    pipelined = entry.data.get(CONF_PIPELINED, False)
+    slow_polling_interval = entry.data.get(CONF_SLOW_POLLING_INTERVAL, 300)
+    max_polling_interval = entry.data.get(CONF_MAX_POLLING_INTERVAL, polling_interval)
+    pack_polling_interval = entry.data.get(CONF_PACK_POLLING_INTERVAL, 60)
+    data_ttl = entry.data.get(CONF_DATA_TTL, 0)
 
     if address is None:
         return False
@@ -54,16 +69,28 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Create data structure
     hass.data.setdefault(DOMAIN, {})
+    # Connection slots are shared by all entries
+    scheduler = hass.data[DOMAIN].setdefault(DATA_SCHEDULER, ConnectionScheduler())
     hass.data[DOMAIN].setdefault(entry.entry_id, {})
     hass.data[DOMAIN][entry.entry_id].setdefault(DATA_POLLING_RUNNING, False)
     # Register options update listener for automatic reload (no full HA restart needed)
     entry.async_on_unload(entry.add_update_listener(_update_listener))
 
+    # Import the device model module outside the event loop, the
+    # coordinator then gets the shared device model from the cache
+    await hass.async_add_executor_job(get_device, address, device_name)
+
     # Create coordinator for polling
     _LOGGER.debug("Creating coordinator")
-    coordinator = PollingCoordinator(hass, address, device_name, polling_interval, persistent_conn, polling_timeout, max_retries, use_encryption)
-    await coordinator.async_config_entry_first_refresh()
+    coordinator = PollingCoordinator(hass, address, device_name, polling_interval, persistent_conn, polling_timeout, max_retries, use_encryption, pipelined, slow_polling_interval, max_polling_interval, pack_polling_interval, scheduler, linger_time, data_ttl)
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Not unloaded if the setup fails, forget the device model here
+        remove_device(address, device_name)
+        raise
     hass.data[DOMAIN][entry.entry_id].setdefault(DATA_COORDINATOR, coordinator)
+    entry.async_on_unload(coordinator.async_start())
 
     _LOGGER.debug("Creating entities")
     # Build list of platforms to load without mutating global constant
@@ -99,6 +126,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if coordinator:
             # Disconnect from device if persistent connection was used
             if coordinator.reader and coordinator.reader.client:
+                coordinator.reader.cancel_linger()
                 try:
                     if coordinator.reader.client.is_connected:
                         if coordinator.reader.has_notifier:
@@ -106,11 +134,13 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                             coordinator.reader.has_notifier = False
                         await coordinator.reader.client.disconnect()
                         _LOGGER.debug("Disconnected from device")
+                    coordinator.reader.release_slot()
                 except Exception as e:
                     _LOGGER.warning("Error disconnecting from device: %s", e)
         
         # Remove data
         hass.data[DOMAIN].pop(entry.entry_id)
+        remove_device(entry.data.get(CONF_ADDRESS), entry.data.get(CONF_NAME))
     
     _LOGGER.debug("Unload complete: %s", unload_ok)
     return unload_ok
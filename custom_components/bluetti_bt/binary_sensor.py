@@ -9,7 +9,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import (
     CONF_ADDRESS,
-    CONF_NAME,
     EntityCategory,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -19,7 +18,6 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .bluetti_bt_lib.field_attributes import FIELD_ATTRIBUTES, FieldType
-from .bluetti_bt_lib.utils.device_builder import build_device
 
 from . import device_info as dev_info, get_unique_id
 from .const import DATA_COORDINATOR, DOMAIN, CONF_USE_CONTROLS
@@ -34,7 +32,6 @@ async def async_setup_entry(
 ) -> None:
     """Setup binary_sensor entities."""
 
-    device_name = entry.data.get(CONF_NAME)
     address = entry.data.get(CONF_ADDRESS)
     use_controls = entry.data.get(CONF_USE_CONTROLS, False)
     if address is None:
@@ -45,7 +42,8 @@ async def async_setup_entry(
     device_info = dev_info(entry)
 
     # Add sensors according to device_info
-    bluetti_device = build_device(address, device_name)
+    coordinator: PollingCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    bluetti_device = coordinator.bluetti_device
 
     sensors_to_add = []
     all_fields = FIELD_ATTRIBUTES
@@ -57,7 +55,7 @@ async def async_setup_entry(
 
                 sensors_to_add.append(
                     BluettiBinarySensor(
-                        hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR],
+                        coordinator,
                         device_info,
                         address,
                         field_key,
@@ -80,7 +78,8 @@ class BluettiBinarySensor(CoordinatorEntity, BinarySensorEntity):
         name: str,
     ):
         """Init battery entity."""
-        super().__init__(coordinator)
+        # Only updated when the value of response_key changed
+        super().__init__(coordinator, context=response_key)
 
         self._attr_has_entity_name = True
         e_name = f"{device_info.get('name')} {name}"
@@ -96,14 +95,14 @@ class BluettiBinarySensor(CoordinatorEntity, BinarySensorEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._attr_available
+        # Not available while the coordinator update failed
+        return super().available and self._attr_available
     
     def _set_available(self):
-        """Set sensor as available."""
+        """Set sensor as available, the state is written by the caller."""
         self._attr_available = True
         self._unavailable_counter = 0
         self._attr_extra_state_attributes = {}
-        self.async_write_ha_state()
 
     def _set_unavailable(self, cause: str = "Unknown"):
         """Set sensor as unavailable."""
@@ -123,10 +122,6 @@ class BluettiBinarySensor(CoordinatorEntity, BinarySensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        if self.coordinator.reader.persistent_conn and not self.coordinator.reader.client.is_connected:
-            self._set_unavailable("BLE disconnected")
-            return
-        
         if self.coordinator.data is None:
             _LOGGER.debug(
                 "Data from coordinator is None",
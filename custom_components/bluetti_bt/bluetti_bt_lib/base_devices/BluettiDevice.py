@@ -2,10 +2,13 @@
 
 # Reduced copy of https://github.com/warhammerkid/bluetti_mqtt/blob/main/bluetti_mqtt/core/devices/bluetti_device.py
 
-from typing import Any, List
+from functools import cached_property
+from typing import Any, Collection, Dict, List
 
+from ..const import MAX_REGISTERS_PER_READ
+from ..field_enums import PollingTier
 from ..utils.commands import ReadHoldingRegisters, WriteSingleRegister
-from ..utils.struct import BoolField, DeviceStruct, EnumField
+from ..utils.struct import BoolField, DeviceField, DeviceStruct, EnumField
 
 
 class BluettiDevice:
@@ -28,10 +31,44 @@ class BluettiDevice:
         """
         return 1
 
+    @property
+    def max_registers_per_read(self) -> int:
+        """The maximum number of registers the device returns in one read"""
+        return MAX_REGISTERS_PER_READ
+
+    @property
+    def polling_tiers(self) -> Dict[str, PollingTier]:
+        """Fields which don't change on every poll. All other fields are fast"""
+        return {}
+
+    def is_polled_address(self, address: int) -> bool:
+        """Registers which are read by the polling commands"""
+        return True
+
+    def get_polling_commands(
+        self,
+        tiers: Collection[PollingTier] | None = None,
+        names: Collection[str] | None = None,
+    ) -> List[ReadHoldingRegisters]:
+        """The commands for polling the fields of the given tiers and names (default all)"""
+        fields = self.struct.fields
+        if names is not None:
+            fields = [f for f in fields if f.name in names]
+        if tiers is not None:
+            tier_of = self.polling_tiers
+            fields = [
+                f for f in fields if tier_of.get(f.name, PollingTier.FAST) in tiers
+            ]
+        return self.struct.get_read_holding_registers(
+            max_registers=self.max_registers_per_read,
+            filter=self.is_polled_address,
+            fields=fields,
+        )
+
     @property
     def polling_commands(self) -> List[ReadHoldingRegisters]:
         """A given device has an optimal set of commands for polling"""
-        raise NotImplementedError
+        return self.get_polling_commands()
 
     @property
     def pack_polling_commands(self) -> List[ReadHoldingRegisters]:
@@ -48,18 +85,23 @@ class BluettiDevice:
         """The address 'range' of the pack num result. Matches pack_num_result"""
         return []
 
+    @cached_property
+    def writable_fields(self) -> Dict[str, DeviceField]:
+        """The first writable field for every field name"""
+        writable = {}
+        for f in self.struct.fields:
+            if f.name not in writable and any(f.address in r for r in self.writable_ranges):
+                writable[f.name] = f
+        return writable
+
     def has_field(self, field: str):
-        return any(f.name == field for f in self.struct.fields)
+        return field in self.struct.fields_by_name
 
     def has_field_setter(self, field: str):
-        matches = [f for f in self.struct.fields if f.name == field]
-        return any(any(f.address in r for r in self.writable_ranges) for f in matches)
+        return field in self.writable_fields
 
     def build_setter_command(self, field: str, value: Any):
-        matches = [f for f in self.struct.fields if f.name == field]
-        device_field = next(
-            f for f in matches if any(f.address in r for r in self.writable_ranges)
-        )
+        device_field = self.writable_fields[field]
 
         # Convert value to an integer
         if isinstance(device_field, EnumField):
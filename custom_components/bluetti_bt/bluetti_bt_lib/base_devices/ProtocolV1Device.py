@@ -1,7 +1,8 @@
 """Base device definition for V1 Protocol devices."""
 
-from typing import List
+from typing import Dict, List
 
+from ..field_enums import PollingTier
 from ..utils.commands import ReadHoldingRegisters
 from ..utils.struct import DeviceStruct
 from .BluettiDevice import BluettiDevice
@@ -45,15 +46,14 @@ class ProtocolV1Device(BluettiDevice):
         super().__init__(address, type, sn)
 
     @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return [
-            ReadHoldingRegisters(10, 10),
-            ReadHoldingRegisters(36, 4),
-            ReadHoldingRegisters(41, 1),
-            ReadHoldingRegisters(43, 1),
-            ReadHoldingRegisters(48, 2),
-            ReadHoldingRegisters(3007, 2),
-        ]
+    def polling_tiers(self) -> Dict[str, PollingTier]:
+        return {
+            "device_type": PollingTier.STATIC,
+            "serial_number": PollingTier.STATIC,
+            "arm_version": PollingTier.STATIC,
+            "dsp_version": PollingTier.STATIC,
+            "power_generation": PollingTier.SLOW,
+        }
 
     @property
     def writable_ranges(self) -> List[range]:
@@ -1,10 +1,10 @@
 """Base device definition for V2 Protocol devices."""
 
-from typing import List
+from typing import Dict, List
 
 from ..utils.commands import ReadHoldingRegisters
 from ..utils.struct import DeviceStruct
-from ..field_enums import ChargingMode#, UpsMode
+from ..field_enums import ChargingMode, PollingTier#, UpsMode
 from .BluettiDevice import BluettiDevice
 
 
@@ -53,13 +53,12 @@ class ProtocolV2Device(BluettiDevice):
         super().__init__(address, type, sn)
 
     @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return [
-            ReadHoldingRegisters(110, 6),
-            ReadHoldingRegisters(116, 4),
-            ReadHoldingRegisters(154, 1),
-            ReadHoldingRegisters(102, 1),
-        ]
+    def polling_tiers(self) -> Dict[str, PollingTier]:
+        return {
+            "device_type": PollingTier.STATIC,
+            "serial_number": PollingTier.STATIC,
+            "power_generation": PollingTier.SLOW,
+        }
 
     @property
     def writable_ranges(self) -> List[range]:
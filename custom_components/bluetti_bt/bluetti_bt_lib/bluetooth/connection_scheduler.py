@@ -0,0 +1,117 @@
+"""Connection slots shared by all devices."""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from typing import Dict, List, Tuple
+
+from ..const import CONNECTION_STAGGER, MAX_CONNECTIONS_PER_ADAPTER
+
+_LOGGER = logging.getLogger(__name__)
+
+# Lower values are served first
+PRIORITY_CONTROL = 0
+PRIORITY_POLL = 1
+
+
+class WaitStats:
+    """Time devices spent waiting for a connection slot"""
+
+    __slots__ = ("count", "total", "last", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def add(self, wait: float):
+        self.count += 1
+        self.total += wait
+        self.last = wait
+        self.max = max(self.max, wait)
+
+    def as_dict(self) -> dict:
+        return {
+            "waits": self.count,
+            "last_wait": round(self.last, 3),
+            "max_wait": round(self.max, 3),
+            "average_wait": round(self.total / self.count, 3) if self.count else 0,
+        }
+
+
+class _Adapter:
+    __slots__ = ("active", "waiters", "last_start")
+
+    def __init__(self):
+        self.active = 0
+        self.waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self.last_start = -CONNECTION_STAGGER
+
+
+class ConnectionScheduler:
+    """Limits the devices connecting or polling at once per bluetooth adapter
+    or proxy.
+
+    Devices wait for a slot in the order they asked for one, control writes
+    before polls. Connection attempts on the same adapter are spaced by
+    `stagger` seconds.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = MAX_CONNECTIONS_PER_ADAPTER,
+        stagger: float = CONNECTION_STAGGER,
+    ):
+        self.max_connections = max_connections
+        self.stagger = stagger
+        self.adapters: Dict[str, _Adapter] = {}
+        self.stats: Dict[str, WaitStats] = {}
+        self._order = itertools.count()
+
+    async def acquire(self, adapter: str, device: str, priority: int = PRIORITY_POLL):
+        """Wait for a free slot. Every acquire needs a release"""
+        state = self.adapters.setdefault(adapter, _Adapter())
+        start = time.monotonic()
+
+        if state.active < self.max_connections and not state.waiters:
+            state.active += 1
+        else:
+            _LOGGER.debug("Waiting for a connection slot on %s", adapter)
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(state.waiters, (priority, next(self._order), future))
+            try:
+                # The slot is handed over by release()
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    self.release(adapter)
+                raise
+
+        try:
+            # Space connection attempts on the same adapter
+            delay = state.last_start + self.stagger - time.monotonic()
+            state.last_start = max(time.monotonic(), state.last_start + self.stagger)
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.release(adapter)
+            raise
+
+        self.stats.setdefault(device, WaitStats()).add(time.monotonic() - start)
+
+    def release(self, adapter: str):
+        """Give the slot to the next waiting device"""
+        state = self.adapters[adapter]
+        while state.waiters:
+            _, _, future = heapq.heappop(state.waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        state.active -= 1
+
+    def diagnostics(self, device: str) -> dict:
+        stats = self.stats.get(device)
+        return WaitStats().as_dict() if stats is None else stats.as_dict()
@@ -1,8 +1,23 @@
 """Device reader."""
 
 import asyncio
+from collections import deque
+import itertools
 import logging
-from typing import Any, Callable, List, cast
+import random
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Tuple,
+    cast,
+)
 import async_timeout
 from bleak import BleakClient, BleakError
 from bleak.backends.device import BLEDevice
@@ -10,15 +25,112 @@ from bleak_retry_connector import (
     BleakClientWithServiceCache,
     establish_connection,
 )
-from custom_components.bluetti_bt.bluetti_bt_lib.bluetooth.encryption import BluettiEncryption, Message, MessageType
+from custom_components.bluetti_bt.bluetti_bt_lib.bluetooth.encryption import (
+    AES_BLOCK_SIZE,
+    BluettiEncryption,
+    Message,
+    MessageType,
+    generate_keypair,
+)
 
+from .connection_scheduler import PRIORITY_POLL, ConnectionScheduler
 from ..base_devices.BluettiDevice import BluettiDevice
-from ..const import NOTIFY_UUID, RESPONSE_TIMEOUT, WRITE_UUID
+from ..const import (
+    HANDSHAKE_TIMEOUT,
+    LINGER_CONNECT_AHEAD,
+    NOTIFY_UUID,
+    PACK_DATA_TTL,
+    PACK_DATA_TTL_INTERVALS,
+    PACK_RETRY_INTERVAL,
+    PACK_SELECT_ATTEMPTS,
+    PACK_SELECT_DELAY,
+    RECONNECT_BACKOFF,
+    RECONNECT_BACKOFF_MAX,
+    RESPONSE_TIMEOUT,
+    WRITE_UUID,
+)
 from ..exceptions import BadConnectionError, ModbusError, ParseError
-from ..utils.commands import ReadHoldingRegisters
+from ..field_enums import PollingTier
+from ..utils.commands import DeviceCommand, ReadHoldingRegisters
+from ..utils.crc import MODBUS_CRC_INIT, modbus_crc
+from ..utils.packs import PackSnapshots
 
 _LOGGER = logging.getLogger(__name__)
 
+# MODBUS exception responses: address, function code, exception code, crc
+EXCEPTION_RESPONSE_SIZE = 5
+# Longer encrypted messages can only be garbage (a full MODBUS frame is 256)
+MAX_ENCRYPTED_DATA_SIZE = 512
+
+
+class PendingCommand:
+    """A command written to the device and waiting for its response.
+
+    Fragments are copied into a buffer preallocated to the expected response
+    size and the CRC is updated as they arrive, so a completed response can
+    be validated without another pass over the data.
+    """
+
+    __slots__ = (
+        "command",
+        "future",
+        "size",
+        "buffer",
+        "view",
+        "received",
+        "crc",
+        "is_exception",
+    )
+
+    def __init__(self, command: DeviceCommand, future: asyncio.Future[Any]):
+        self.command = command
+        self.future = future
+        self.size = command.response_size()
+        self.buffer = bytearray(self.size)
+        self.view = memoryview(self.buffer)
+        self.received = 0
+        self.crc = MODBUS_CRC_INIT
+        self.is_exception = False
+
+    @property
+    def is_complete(self) -> bool:
+        return self.received == self.size
+
+    @property
+    def is_valid(self) -> bool:
+        return self.crc == self.buffer[self.size - 2] | self.buffer[self.size - 1] << 8
+
+    def feed(self, data: memoryview) -> int:
+        """Add a fragment and return the number of bytes consumed"""
+        start = self.received
+        count = min(len(data), self.size - start)
+        self.view[start : start + count] = data[:count]
+        self.received += count
+
+        # MODBUS exceptions are shorter than the expected response
+        if (
+            not self.is_exception
+            and self.received >= 2
+            and self.command.is_exception_response(self.view[:2])
+        ):
+            self.is_exception = True
+            self.size = EXCEPTION_RESPONSE_SIZE
+            if self.received > self.size:
+                count -= self.received - self.size
+                self.received = self.size
+
+        crc_end = min(self.received, self.size - 2)
+        if crc_end > start:
+            self.crc = modbus_crc(self.view[start:crc_end], self.crc)
+
+        return count
+
+
+def reconnect_backoff(attempt: int) -> float:
+    """Randomized exponential backoff, keeps devices from retrying in lockstep"""
+    delay = min(RECONNECT_BACKOFF * 2 ** (attempt - 1), RECONNECT_BACKOFF_MAX)
+    return delay * random.uniform(0.5, 1.5)
+
 
 class DeviceReader:
     def __init__(
@@ -29,9 +141,14 @@ class DeviceReader:
         ble_device: BLEDevice | None = None,
         device_name: str | None = None,        
         persistent_conn: bool = False,
+        linger_time: int = 0,
         polling_timeout: int = 45,
         max_retries: int = 5,
         encrypted: bool = False,
+        pipeline_window: int = 1,
+        pack_polling_interval: int = 0,
+        scheduler: ConnectionScheduler | None = None,
+        priority_fields: Collection[str] = (),
     ) -> None:
         self.client = bleak_client
         self.bluetti_device = bluetti_device
@@ -40,213 +157,540 @@ class DeviceReader:
         self.ble_device = ble_device
         self.device_name = device_name or getattr(ble_device, "name", None) or "Bluetti"
         self.persistent_conn = persistent_conn
+        # Seconds a connection is kept open after a poll if not persistent
+        self.linger_time = linger_time
+        self.linger_task: asyncio.Task | None = None
+        self.polls = 0
         self.polling_timeout = polling_timeout
         self.max_retries = max_retries
         self.encrypted = encrypted
+        # Number of requests kept in flight, 1 waits for every response
+        self.pipeline_window = max(1, pipeline_window)
+
+        # Connection slots shared with other devices on the same adapter
+        self.scheduler = scheduler
+        self.adapter = "default"
+        self.slot_adapter: str | None = None
 
         self.has_notifier = False
-        self.notify_future: asyncio.Future[Any] | None = None
-        self.current_command = None
-        self.notify_response = bytearray()
+        # Called after the connection was lost unexpectedly
+        self.disconnected_callback: Callable[[], None] | None = None
+        # Requests waiting for a response, in the order they were sent
+        self.pending: Deque[PendingCommand] = deque()
+        # Set when late responses may still arrive, see _async_resync
+        self.out_of_sync = False
 
         # polling mutex to guard against switches
         self.polling_lock = asyncio.Lock()
 
+        # The secure session is kept while the connection is up
         self.encryption = BluettiEncryption()
+        self.encryption_ready = asyncio.Event()
+        # Local keypair for the next key exchange, generated in the background
+        self.next_keypair: asyncio.Future | None = None
+        # Encrypted notifications not forming a complete message yet
+        self.encrypted_buffer = bytearray()
+
+        # Commands reading these fields are sent first
+        self.priority_addresses: FrozenSet[int] = frozenset()
+        if bluetti_device is not None:
+            self.priority_addresses = frozenset(
+                f.address
+                for name in priority_fields
+                for f in bluetti_device.struct.fields_by_name.get(name, ())
+            )
 
-        self.set_pack = 0
-        self.scaned_pack = 0
-        self.skip_pack_count = 0
-        self.packs = {}
+        # The polling plan is built only once, set_demand plans it again
+        self.polling_commands: Tuple[ReadHoldingRegisters, ...] = ()
+        self.pack_commands: Tuple[ReadHoldingRegisters, ...] = ()
+        if bluetti_device is not None:
+            self.polling_commands = self._prioritized(bluetti_device.polling_commands)
+            self.pack_commands = tuple(bluetti_device.pack_polling_commands)
+        # Polling commands for combinations of tiers, planned on first use
+        self.tier_commands: Dict[
+            FrozenSet[PollingTier], Tuple[ReadHoldingRegisters, ...]
+        ] = {}
+        # Fields to poll, None polls all fields and packs
+        self.demand: FrozenSet[str] | None = None
+        self.read_packs = True
+
+        # Seconds between two reads of the same battery pack
+        self.pack_polling_interval = pack_polling_interval
+        # Pack data is dropped if not updated for a few pack polling intervals
+        self.packs = PackSnapshots(
+            max(PACK_DATA_TTL, PACK_DATA_TTL_INTERVALS * pack_polling_interval)
+        )
+        # Last time a pack couldn't be selected, e.g. an empty slot
+        self.pack_failed_at: Dict[int, float] = {}
 
     async def read_data(
-        self, filter_registers: List[ReadHoldingRegisters] | None = None
+        self,
+        filter_registers: List[ReadHoldingRegisters] | None = None,
+        tiers: Collection[PollingTier] | None = None,
+        on_data: Callable[[dict], None] | None = None,
     ) -> dict | None:
+        """Read all polling commands and the due battery packs.
+
+        If given, on_data is called with the values of every command as soon
+        as they are parsed, before the remaining commands are read.
+        """
         _LOGGER.info("Reading data")
 
         if self.bluetti_device is None:
             _LOGGER.error("Device is None")
             return None
 
-        polling_commands = self.bluetti_device.polling_commands
-        pack_commands = self.bluetti_device.pack_polling_commands
+        polling_commands = self.polling_commands
+        pack_commands = self.pack_commands
+        if tiers is not None:
+            polling_commands = self._get_tier_commands(tiers)
         if filter_registers is not None:
             polling_commands = filter_registers
             pack_commands = []
-        _LOGGER.info("Polling commands: " + ",".join([f"{c.starting_address}-{c.starting_address + c.quantity - 1}" for c in polling_commands]))
-        _LOGGER.info("Pack comands: " + ",".join([f"{c.starting_address}-{c.starting_address + c.quantity - 1}" for c in pack_commands]))
+        _LOGGER.info("Polling commands: %s", polling_commands)
+        _LOGGER.info("Pack comands: %s", pack_commands)
 
         parsed_data: dict = {}
+        packs_read = False
+
+        # A lingering connection is kept for this poll
+        self.polls += 1
 
         async with self.polling_lock:
+            lingering = False
             try:
                 async with async_timeout.timeout(self.polling_timeout):
-                    # Reconnect if not connected
-                    for attempt in range(1, self.max_retries + 1):
-                        try:
-                            if not self.client.is_connected:
-                                # On reconnect: clear notification handler state
-                                # to avoid stale subscriptions bound to the old connection
-                                try:
-                                    if self.has_notifier:
-                                        await self.client.stop_notify(NOTIFY_UUID)
-                                    await self.client.disconnect()
-                                except:
-                                    pass  # Ignore disconnect cleanup errors
-                                finally:
-                                    # Reset all notification-related state before new connection
-                                    self.has_notifier = False
-                                    self.notify_future = None
-                                    self.current_command = None
-                                    self.notify_response = bytearray()
-
-                                # Use bleak-retry-connector to establish a reliable connection
-                                if self.ble_device is None:
-                                    raise BleakError(
-                                        "BLEDevice is not provided; cannot establish connection reliably"
-                                    )
-                                self.client = await establish_connection(
-                                    BleakClientWithServiceCache,
-                                    self.ble_device,
-                                    self.device_name,
-                                    max_attempts=self.max_retries,
-                                )
-                            break
-                        except Exception as e:
-                            if attempt == self.max_retries:
-                                raise e # pass exception on max_retries attempt
-                            else:
-                                await asyncio.sleep(2)
-
-                    # Attach notifier if needed
-                    if not self.has_notifier:
-                        await self.client.start_notify(
-                            NOTIFY_UUID, self._notification_handler
-                        )
-                        self.has_notifier = True
-
-                    while self.encrypted and not self.encryption.is_ready_for_commands:
-                        await asyncio.sleep(5)
-                        _LOGGER.debug("Encryption handshake not finished yet")
+                    # Waiting for a slot counts against the polling timeout
+                    await self.acquire_slot(PRIORITY_POLL)
+                    await self._async_connect()
 
                     # Execute polling commands
-                    for command in polling_commands:
+                    async for command, response in self._async_stream_commands(
+                        polling_commands
+                    ):
                         try:
-                            body = command.parse_response(
-                                await self._async_send_command(command)
-                            )
+                            body = command.parse_response(response)
                             _LOGGER.debug("Raw data: %s", body)
                             parsed = self.bluetti_device.parse(
                                 command.starting_address, body
                             )
                             _LOGGER.debug("Parsed data: %s", parsed)
                             parsed_data.update(parsed)
+                            if on_data is not None and parsed:
+                                on_data(parsed)
                         except ParseError:
                             _LOGGER.warning("Got a parse exception")
 
                     # Execute pack polling commands
-                    if len(pack_commands) > 0 and len(self.bluetti_device.pack_num_field) == 1:
-                        if self.skip_pack_count > 0:
-                            self.skip_pack_count -= 1                        
-                        elif self.set_pack == self.scaned_pack:
-                            self.skip_pack_count = 1
-                            self.set_pack = self.scaned_pack + 1 if self.scaned_pack < self.bluetti_device.pack_num_max else 1
-
-                            command = self.bluetti_device.build_setter_command(
-                            "pack_num", self.set_pack
-                            )
-                            await self._async_send_command(command)
-                        else:
-                            pack_temp = {}
-
-                            for command in pack_commands:
-                                # Request & parse result for each pack
-                                try:
-                                    body = command.parse_response(
-                                        await self._async_send_command(command)
-                                    )
-                                    parsed = self.bluetti_device.parse(
-                                        command.starting_address, body
-                                    )
-
-                                    pack_temp.update(parsed)
-                                except ParseError:
-                                    _LOGGER.warning("Got a parse exception...")
-
-                            pack_num = pack_temp.get('pack_num_result')
-                            is_pack_disconnected = pack_temp.get('pack_bms_version') == 0
-
-                            if is_pack_disconnected:
-                                pack_temp.update({ 'pack_battery_percent': None })
-
-                            if pack_num == self.set_pack:
-                                self.packs.setdefault(pack_num, {}).update(pack_temp)
-                                self.scaned_pack = pack_num
-                            else:
-                                self.set_pack = 0
-                                self.scaned_pack = 0
-                                self.skip_pack_count = 1
+                    if (
+                        len(pack_commands) > 0
+                        and self.read_packs
+                        and len(self.bluetti_device.pack_num_field) == 1
+                    ):
+                        packs_read = await self._async_scan_packs(pack_commands)
+
+                    # Keep the connection for the next poll, see schedule_linger
+                    lingering = self.linger_time > 0
 
+            # The values read before an error are still returned
             except TimeoutError:
                 _LOGGER.warning(f"Polling timed out ({self.polling_timeout}s). Trying again later")                
-                return None
             except BleakError as err:
                 _LOGGER.error("Bleak error: %s", err)
-                return None
             finally:
                 # Disconnect if connection not persistant
-                if not self.persistent_conn:
-                    if self.has_notifier:
-                        try:
-                            await self.client.stop_notify(NOTIFY_UUID)
-                        except:
-                            # Ignore errors here
-                            pass
-                        self.has_notifier = False
-                    
-                    # Clear notification state before disconnect to avoid warnings
-                    self.notify_future = None
-                    self.current_command = None
-                    self.notify_response = bytearray()    
-
-                    await self.client.disconnect()
-
-            for pack_index, pack_data in self.packs.items():
-                for key, value in pack_data.items():
-                    parsed_data.update({key + str(pack_index): value})
-
-            # Check if dict is empty
-            if not parsed_data:
-                return None
+                if not self.persistent_conn and not lingering:
+                    await self._async_disconnect()
 
-            # Reset Encryption keys
-            self.encryption.reset()
+                # Connections kept open don't hold a slot between polls
+                self.release_slot()
 
+            # A poll which read nothing failed, even if pack data is cached
+            if not parsed_data and not packs_read:
+                return None
+
+            self.packs.flatten(parsed_data)
             return parsed_data
 
-    async def _async_send_command(self, command: ReadHoldingRegisters) -> bytes:
-        """Send command and return response"""
-        try:
-            # Prepare to make request
-            self.current_command = command
-            self.notify_future = self.create_future()
-            self.notify_response = bytearray()
+    async def _async_connect(self):
+        """Connect, attach the notifier and wait for the encryption handshake"""
+        # Reconnect if not connected
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                # A connection with a failed or stuck handshake
+                # doesn't recover, connect again
+                handshake_failed = (
+                    self.encrypted
+                    and self.has_notifier
+                    and not self.encryption_ready.is_set()
+                )
+                if not self.client.is_connected or handshake_failed:
+                    # On reconnect: clear notification handler state
+                    # to avoid stale subscriptions bound to the old connection
+                    try:
+                        await self._async_disconnect()
+                    except:
+                        pass  # Ignore disconnect cleanup errors
+
+                    # Use bleak-retry-connector to establish a reliable connection
+                    if self.ble_device is None:
+                        raise BleakError(
+                            "BLEDevice is not provided; cannot establish connection reliably"
+                        )
+                    self.client = await establish_connection(
+                        BleakClientWithServiceCache,
+                        self.ble_device,
+                        self.device_name,
+                        disconnected_callback=self._on_disconnected,
+                        max_attempts=self.max_retries,
+                    )
+
+                # Attach notifier if needed
+                if not self.has_notifier:
+                    await self.client.start_notify(
+                        NOTIFY_UUID, self._notification_handler
+                    )
+                    self.has_notifier = True
+
+                if self.encrypted and not self.encryption_ready.is_set():
+                    # A stuck handshake times out, the next attempt connects
+                    # again (handshake_failed)
+                    _LOGGER.debug("Waiting for encryption handshake")
+                    try:
+                        async with async_timeout.timeout(HANDSHAKE_TIMEOUT):
+                            await self.encryption_ready.wait()
+                    except TimeoutError as err:
+                        raise BleakError("Encryption handshake timed out") from err
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise e # pass exception on max_retries attempt
+                else:
+                    await asyncio.sleep(reconnect_backoff(attempt))
+
+    async def _async_disconnect(self):
+        # The notification state is reset before disconnecting, so
+        # _on_disconnected knows the disconnect was expected
+        if self.has_notifier:
+            self.has_notifier = False
+            try:
+                await self.client.stop_notify(NOTIFY_UUID)
+            except:
+                # Ignore errors here
+                pass
 
-            # Make request
-            _LOGGER.debug("Requesting %s", command)
+        # Clear notification state before disconnect to avoid warnings
+        self.pending.clear()
+        self.out_of_sync = False
+        self._reset_encryption()
 
-            command_bytes = bytes(command)
+        await self.client.disconnect()
 
-            # Encrypt command
-            if self.encrypted is True:
-                if not self.encryption.is_ready_for_commands:
-                    return bytes()
-                command_bytes = self.encryption.aes_encrypt(command_bytes, self.encryption.secure_aes_key, None)
+    def _on_disconnected(self, client: BleakClient):
+        """Called by bleak when the connection is lost"""
+        if client is not self.client or not self.has_notifier:
+            return
 
+        _LOGGER.debug("Connection lost")
+        self.has_notifier = False
+        # Fail requests in flight right away instead of waiting for a timeout
+        err = BadConnectionError("Disconnected")
+        for pending in self.pending:
+            if not pending.future.done():
+                pending.future.set_exception(err)
+        self.pending.clear()
+        self.out_of_sync = False
+        self._reset_encryption()
+
+        if self.disconnected_callback is not None:
+            self.disconnected_callback()
+
+    def schedule_linger(self, next_poll_in: float):
+        """Keep the connection for linger_time seconds after a poll.
+
+        If the next poll comes within the linger time (plus the time needed
+        to connect) the connection is kept until then. Otherwise it is closed
+        after linger_time seconds and opened again LINGER_CONNECT_AHEAD
+        seconds before the next poll.
+        """
+        self.cancel_linger()
+        if self.persistent_conn or self.linger_time <= 0:
+            return
+        self.linger_task = asyncio.create_task(
+            self._async_linger(next_poll_in, self.polls)
+        )
+
+    def cancel_linger(self):
+        if self.linger_task is not None:
+            self.linger_task.cancel()
+            self.linger_task = None
+
+    async def _async_linger(self, next_poll_in: float, polls: int):
+        start = time.monotonic()
+        reconnect = next_poll_in > self.linger_time + LINGER_CONNECT_AHEAD
+        if reconnect:
+            await asyncio.sleep(self.linger_time)
+        else:
+            # Only disconnect if the next poll doesn't come
+            await asyncio.sleep(next_poll_in + self.linger_time)
+
+        async with self.polling_lock:
+            # Polled in the meantime, the next linger is scheduled already
+            if polls != self.polls or not self.client.is_connected:
+                return
+            _LOGGER.debug("Closing idle connection")
+            try:
+                await self._async_disconnect()
+            except BleakError as err:
+                _LOGGER.debug("Disconnect failed: %s", err)
+
+        if not reconnect:
+            return
+        await asyncio.sleep(
+            next_poll_in - LINGER_CONNECT_AHEAD - (time.monotonic() - start)
+        )
+
+        async with self.polling_lock:
+            if polls != self.polls:
+                return
+            _LOGGER.debug("Connecting ahead of the next poll")
+            try:
+                async with async_timeout.timeout(self.polling_timeout):
+                    await self.acquire_slot(PRIORITY_POLL)
+                    await self._async_connect()
+            except (TimeoutError, BleakError) as err:
+                # The poll tries again
+                _LOGGER.debug("Connecting ahead failed: %s", err)
+            finally:
+                self.release_slot()
+
+    async def acquire_slot(self, priority: int):
+        """Wait for a slot of the adapter, held until release_slot.
+
+        A slot is held while connecting and talking to the device, always
+        under polling_lock. Connections kept open between polls don't hold
+        one, so persistent devices can't lock out the others.
+        """
+        if self.scheduler is None or self.slot_adapter is not None:
+            return
+        adapter = self.adapter
+        await self.scheduler.acquire(adapter, self.bluetti_device.address, priority)
+        self.slot_adapter = adapter
+
+    def release_slot(self):
+        if self.slot_adapter is not None:
+            self.scheduler.release(self.slot_adapter)
+            self.slot_adapter = None
+
+    async def _async_scan_packs(
+        self, pack_commands: Tuple[ReadHoldingRegisters, ...]
+    ) -> bool:
+        """Select and read all packs which are due in this connection.
+
+        Returns True if a pack was read.
+
+        Selecting the next pack is sent right after the reads of the current
+        pack. If pack_num_result shows the device didn't switch to the pack
+        yet, the pack is selected again and read after a short delay. The
+        retries don't select the next pack, it is selected once they are
+        done. A pack which still isn't selected is skipped for
+        PACK_RETRY_INTERVAL seconds (or the pack polling interval if longer).
+        """
+        now = time.monotonic()
+        retry_interval = max(self.pack_polling_interval, PACK_RETRY_INTERVAL)
+        due = [
+            pack
+            for pack in range(1, self.bluetti_device.pack_num_max + 1)
+            if (
+                (updated_at := self.packs.updated_at(pack)) is None
+                or now - updated_at >= self.pack_polling_interval
+            )
+            and (
+                (failed_at := self.pack_failed_at.get(pack)) is None
+                or now - failed_at >= retry_interval
+            )
+        ]
+        if not due:
+            return False
+
+        def select(pack: int) -> DeviceCommand:
+            return self.bluetti_device.build_setter_command("pack_num", pack)
+
+        read = False
+        await self._async_send_command(select(due[0]))
+        for index, pack in enumerate(due):
+            next_pack = due[index + 1] if index + 1 < len(due) else None
+            commands = list(pack_commands)
+            if next_pack is not None:
+                commands.append(select(next_pack))
+
+            selected = False
+            for attempt in range(1, PACK_SELECT_ATTEMPTS + 1):
+                pack_temp = {}
+                async for command, response in self._async_stream_commands(commands):
+                    if not isinstance(command, ReadHoldingRegisters):
+                        continue
+                    try:
+                        body = command.parse_response(response)
+                        parsed = self.bluetti_device.parse(
+                            command.starting_address, body
+                        )
+                        pack_temp.update(parsed)
+                    except ParseError:
+                        _LOGGER.warning("Got a parse exception...")
+
+                selected = pack_temp.get("pack_num_result") == pack
+                if selected or attempt == PACK_SELECT_ATTEMPTS:
+                    break
+
+                _LOGGER.debug("Pack %s not selected yet (attempt %s)", pack, attempt)
+                # Selecting the next pack again would switch the device back
+                # and forth between both packs
+                commands = list(pack_commands)
+                await self._async_send_command(select(pack))
+                await asyncio.sleep(PACK_SELECT_DELAY)
+
+            if next_pack is not None and attempt > 1:
+                await self._async_send_command(select(next_pack))
+
+            if not selected:
+                # Don't spend the select attempts on every poll
+                self.pack_failed_at[pack] = time.monotonic()
+                continue
+            self.pack_failed_at.pop(pack, None)
+
+            if pack_temp.get("pack_bms_version") == 0:
+                # Pack disconnected
+                pack_temp.update({"pack_battery_percent": None})
+
+            self.packs.update(pack, pack_temp)
+            read = True
+
+        return read
+
+    def set_demand(self, names: Collection[str] | None):
+        """Only poll the given fields from now on, None polls all fields.
+
+        Battery packs are only read if a pack field (named pack_...) is
+        demanded.
+        """
+        demand = None if names is None else frozenset(names)
+        if demand == self.demand:
+            return
+        self.demand = demand
+        self.polling_commands = self._prioritized(
+            self.bluetti_device.get_polling_commands(names=demand)
+        )
+        self.tier_commands.clear()
+        self.read_packs = demand is None or any(n.startswith("pack_") for n in demand)
+        _LOGGER.debug("Polling plan changed: %s", self.polling_commands)
+
+    def _prioritized(
+        self, commands: List[ReadHoldingRegisters]
+    ) -> Tuple[ReadHoldingRegisters, ...]:
+        """Commands reading priority fields first, otherwise in planned order"""
+        priority = self.priority_addresses
+
+        def reads_priority_field(command: ReadHoldingRegisters) -> bool:
+            start = command.starting_address
+            return any(start <= a < start + command.quantity for a in priority)
+
+        return tuple(sorted(commands, key=lambda c: not reads_priority_field(c)))
+
+    def _get_tier_commands(
+        self, tiers: Collection[PollingTier]
+    ) -> Tuple[ReadHoldingRegisters, ...]:
+        """Polling commands covering only the fields of the given tiers"""
+        key = frozenset(tiers)
+        commands = self.tier_commands.get(key)
+        if commands is None:
+            commands = self._prioritized(
+                self.bluetti_device.get_polling_commands(key, self.demand)
+            )
+            self.tier_commands[key] = commands
+        return commands
+
+    async def _async_send_command(self, command: DeviceCommand) -> bytes:
+        """Send command and return response"""
+        future = await self._async_write_command(command)
+        return await self._async_wait_response(command, future)
+
+    async def _async_stream_commands(
+        self, commands: List[DeviceCommand]
+    ) -> AsyncIterator[Tuple[DeviceCommand, bytes]]:
+        """Send commands and yield their responses in order.
+
+        Up to pipeline_window requests are in flight at once. MODBUS has no
+        transaction ids, so responses are matched to requests by order. If a
+        request fails the remaining requests can't be matched reliably, so the
+        requests still in flight are sent again one by one.
+        """
+        window = self.pipeline_window
+        queue: Deque[Tuple[DeviceCommand, asyncio.Future[Any]]] = deque()
+        remaining = iter(commands)
+
+        while True:
+            while len(queue) < window:
+                command = next(remaining, None)
+                if command is None:
+                    break
+                queue.append((command, await self._async_write_command(command)))
+
+            if not queue:
+                return
+
+            command, future = queue.popleft()
+            response = await self._async_wait_response(command, future)
+
+            if not response and queue:
+                _LOGGER.debug("Pipelined request failed, falling back to single requests")
+                for _, in_flight in queue:
+                    in_flight.cancel()
+                remaining = itertools.chain([c for c, _ in queue], remaining)
+                queue.clear()
+                # The responses of the abandoned requests may still arrive
+                self.out_of_sync = True
+                window = 1
+
+            yield command, response
+
+    async def _async_write_command(self, command: DeviceCommand) -> asyncio.Future[Any]:
+        """Write command and return the future for its response"""
+        future = self.create_future()
+
+        # Make request
+        _LOGGER.debug("Requesting %s", command)
+
+        if self.out_of_sync:
+            await self._async_resync()
+
+        command_bytes = bytes(command)
+
+        # Encrypt command
+        if self.encrypted is True:
+            if not self.encryption.is_ready_for_commands:
+                future.set_result(bytes())
+                return future
+            command_bytes = self.encryption.aes_encrypt(command_bytes, self.encryption.secure_aes_key, None)
+
+        pending = PendingCommand(command, future)
+        self.pending.append(pending)
+
+        try:
             await self.client.write_gatt_char(WRITE_UUID, command_bytes)
+        except BleakError as err:
+            self._remove_pending(pending)
+            future.set_exception(err)
+
+        return future
 
+    async def _async_wait_response(
+        self, command: DeviceCommand, future: asyncio.Future[Any]
+    ) -> bytes:
+        """Wait for the response of a written command"""
+        try:
             # Wait for response
-            res = await asyncio.wait_for(self.notify_future, timeout=RESPONSE_TIMEOUT)
+            res = await asyncio.wait_for(future, timeout=RESPONSE_TIMEOUT)
 
             # Process data
             _LOGGER.debug("Got %s bytes", len(res))
@@ -254,6 +698,10 @@ class DeviceReader:
 
         except TimeoutError:
             _LOGGER.debug("Polling single command timed out")
+            self.out_of_sync = True
+        except ParseError:
+            _LOGGER.warning("Got a parse exception")
+            self.out_of_sync = True
         except ModbusError as err:
             _LOGGER.debug(
                 "Got an invalid request error for %s: %s",
@@ -265,12 +713,38 @@ class DeviceReader:
             pass
 
         finally:
-            # Clear the future to prevent late notifications from causing warnings
-            self.notify_future = None
+            # Forget the request to prevent late notifications from causing warnings
+            for pending in self.pending:
+                if pending.future is future:
+                    self._remove_pending(pending)
+                    break
 
         # caught an exception, return empty bytes object
         return bytes()
 
+    async def _async_resync(self):
+        """Drop the late responses of failed or abandoned requests.
+
+        Responses are matched to requests by order only, a late response
+        would otherwise be taken for the response of the next request.
+        """
+        _LOGGER.debug("Waiting for late responses before the next request")
+        self.pending.clear()
+        await asyncio.sleep(RESPONSE_TIMEOUT)
+        self.out_of_sync = False
+
+    def _reset_encryption(self):
+        """Forget the secure session, a new one is negotiated on connect"""
+        self.encryption.reset()
+        self.encryption_ready.clear()
+        self.encrypted_buffer.clear()
+
+    def _remove_pending(self, pending: PendingCommand):
+        try:
+            self.pending.remove(pending)
+        except ValueError:
+            pass
+
     async def _notification_handler(self, _sender: int, data: bytearray):
         """Handle bt data."""
 
@@ -279,12 +753,16 @@ class DeviceReader:
             message = Message(data)
 
             # Handle key exchange
-            if message.is_pre_key_exchange:
+            if not self.encrypted_buffer and message.is_pre_key_exchange:
                 message.verify_checksum()
 
                 if message.type == MessageType.CHALLENGE:
                     challenge_response = self.encryption.msg_challenge(message)
                     await self.client.write_gatt_char(WRITE_UUID, challenge_response)
+                    if self.next_keypair is None:
+                        self.next_keypair = asyncio.get_running_loop().run_in_executor(
+                            None, generate_keypair
+                        )
                     return
 
                 if message.type == MessageType.CHALLENGE_ACCEPTED:
@@ -293,46 +771,116 @@ class DeviceReader:
 
             if self.encryption.unsecure_aes_key is None:
                 _LOGGER.error("Received encrypted message before key initialization")
+                return
 
-            key, iv = self.encryption.getKeyIv()
-            decrypted = Message(self.encryption.aes_decrypt(message.buffer, key, iv))
+            # Encrypted messages can be split over several notifications
+            self.encrypted_buffer += data
+            while (frame := self._pop_encrypted_frame()) is not None:
+                await self._handle_encrypted_frame(frame)
+            return
 
-            if decrypted.is_pre_key_exchange:
-                decrypted.verify_checksum()
+        self._handle_response(data)
 
-                if decrypted.type == MessageType.PEER_PUBKEY:
-                    peer_pubkey_response = self.encryption.msg_peer_pubkey(decrypted)
-                    await self.client.write_gatt_char(WRITE_UUID, peer_pubkey_response)
-                    return
+    def _pop_encrypted_frame(self) -> bytes | None:
+        """Take the next complete encrypted message off the buffer.
 
-                if decrypted.type == MessageType.PUBKEY_ACCEPTED:
-                    self.encryption.msg_key_accepted(decrypted)
-                    return
+        Messages start with the 2 byte length of the plain data, followed by
+        a 4 byte iv seed once the secure key is used, and the data padded to
+        the AES block size.
+        """
+        buffer = self.encrypted_buffer
+        if len(buffer) < 2:
+            return None
+
+        data_len = (buffer[0] << 8) + buffer[1]
+        if data_len > MAX_ENCRYPTED_DATA_SIZE:
+            _LOGGER.warning("Dropping encrypted data with invalid length %s", data_len)
+            buffer.clear()
+            return None
+
+        header_size = 2 if self.encryption.secure_aes_key is None else 6
+        size = header_size + -(-data_len // AES_BLOCK_SIZE) * AES_BLOCK_SIZE
+        if len(buffer) < size:
+            return None
 
-            # Handle as message
-            data = decrypted.buffer
+        frame = bytes(buffer[:size])
+        del buffer[:size]
+        return frame
 
+    async def _handle_encrypted_frame(self, frame: bytes):
+        key, iv = self.encryption.getKeyIv()
+        try:
+            decrypted = Message(self.encryption.aes_decrypt(frame, key, iv))
+        except ValueError as err:
+            # The session is broken, the next poll connects again
+            _LOGGER.warning("Failed to decrypt notification: %s", err)
+            self._reset_encryption()
+            return
+
+        if decrypted.is_pre_key_exchange:
+            decrypted.verify_checksum()
+
+            # Signatures and key derivation would block the event loop
+            loop = asyncio.get_running_loop()
+
+            if decrypted.type == MessageType.PEER_PUBKEY:
+                keypair = None
+                if self.next_keypair is not None:
+                    keypair = await self.next_keypair
+                    self.next_keypair = None
+                peer_pubkey_response = await loop.run_in_executor(
+                    None, self.encryption.msg_peer_pubkey, decrypted, keypair
+                )
+                await self.client.write_gatt_char(WRITE_UUID, peer_pubkey_response)
+                return
+
+            if decrypted.type == MessageType.PUBKEY_ACCEPTED:
+                await loop.run_in_executor(
+                    None, self.encryption.msg_key_accepted, decrypted
+                )
+                self.encryption_ready.set()
+                return
+
+        # Handle as message
+        self._handle_response(decrypted.buffer)
+
+    def _handle_response(self, data: bytes):
+        """Feed plain response data to the pending commands"""
         # Ignore notifications we don't expect
         # This can happen during disconnect or when no command is pending
-        if self.notify_future is None or self.notify_future.done():
+        if not self.pending:
             _LOGGER.debug("Ignoring notification (no pending command): %s bytes", len(data))
             return
 
         # If something went wrong, we might get weird data.
         if data == b"AT+NAME?\r" or data == b"AT+ADV?\r":
             err = BadConnectionError("Got AT+ notification")
-            self.notify_future.set_exception(err)
+            self.pending.popleft().future.set_exception(err)
             return
 
-        # Save data
-        self.notify_response.extend(data)
-
-        if len(self.notify_response) == self.current_command.response_size():
-            if self.current_command.is_valid_response(self.notify_response):
-                self.notify_future.set_result(self.notify_response)
+        # A notification may complete one response and start the next one
+        view = memoryview(data)
+        while view and self.pending:
+            pending = self.pending[0]
+
+            # Save data
+            view = view[pending.feed(view) :]
+            if not pending.is_complete:
+                return
+
+            self.pending.popleft()
+
+            if pending.future.done():
+                continue
+
+            if pending.is_exception:
+                # We got a MODBUS command exception
+                msg = f"MODBUS Exception {pending.command}: {pending.buffer[2]}"
+                pending.future.set_exception(ModbusError(msg))
+            elif not pending.is_valid:
+                pending.future.set_exception(ParseError("Failed checksum"))
+            elif not pending.command.is_matching_response(pending.buffer):
+                # E.g. the late response of a request which timed out
+                pending.future.set_exception(ParseError("Unexpected response"))
             else:
-                self.notify_future.set_exception(ParseError("Failed checksum"))
-        elif self.current_command.is_exception_response(self.notify_response):
-            # We got a MODBUS command exception
-            msg = f"MODBUS Exception {self.current_command}: {self.notify_response[2]}"
-            self.notify_future.set_exception(ModbusError(msg))
+                pending.future.set_result(pending.buffer)
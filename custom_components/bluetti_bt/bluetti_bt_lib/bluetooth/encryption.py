@@ -1,4 +1,5 @@
 from enum import Enum
+from functools import cache
 import hashlib
 import logging
 import os
@@ -63,6 +64,17 @@ def der_to_raw_ecdsa(sig):
 
     return b"".join([int.to_bytes(int(x), 0x20, "big") for x in seq])
 
+@cache
+def peer_verifying_key() -> ec.EllipticCurvePublicKey:
+    """Well-known key the peer signs its pubkey with"""
+    return serialization.load_der_public_key(bytes.fromhex(PUBLIC_KEY_K2))
+
+@cache
+def local_signing_key() -> ec.EllipticCurvePrivateKey:
+    """Well-known key we sign our pubkey with"""
+    signing_secret = int.from_bytes(bytes.fromhex(PRIVATE_KEY_L1), "big")
+    return ec.derive_private_key(signing_secret, ec.SECP256R1())
+
 def verify_and_extract_signed_data(message, signed_data_suffix: bytes | None):
     # 64 bytes of data
     # 64 bytes of signature
@@ -74,8 +86,7 @@ def verify_and_extract_signed_data(message, signed_data_suffix: bytes | None):
     signed_data = data.tobytes() + signed_data_suffix
     der_signature = raw_ecdsa_to_der(signature)
     try:
-        key_bytes = bytes.fromhex(PUBLIC_KEY_K2)
-        serialization.load_der_public_key(key_bytes).verify(
+        peer_verifying_key().verify(
             der_signature, signed_data, ec.ECDSA(hashes.SHA256())
         )
         _LOGGER.debug("Signature OK")
@@ -187,44 +198,58 @@ class BluettiEncryption:
     def is_ready_for_commands(self) -> bool:
         return self.secure_aes_key is not None and self.peer_pubkey is not None
 
-    def aes_decrypt(self, data: bytes, aes_key: bytes | None, iv: bytes | None):
+    def aes_decrypt(self, data: bytes, aes_key: bytes | None, iv: bytes | None) -> bytearray:
         data_len = (data[0] << 8) + data[1]
 
+        view = memoryview(data)
         if iv is None:
-            iv = hashlib.md5(data[2:6]).digest()
-            encrypted = memoryview(data)[6:]
+            iv = hashlib.md5(view[2:6]).digest()
+            encrypted = view[6:]
         else:
-            encrypted = memoryview(data[2:])
+            encrypted = view[2:]
 
         if len(encrypted) % AES_BLOCK_SIZE != 0:
             raise ValueError("Data not aligned on aes block size")
 
-        cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv))
-        decryptor = cipher.decryptor()
-        decrypted = decryptor.update(encrypted) + decryptor.finalize()
-        decrypted = decrypted[:data_len]
+        # Decrypt into one buffer and cut the padding off in place
+        decryptor = Cipher(algorithms.AES(aes_key), modes.CBC(iv)).decryptor()
+        decrypted = bytearray(len(encrypted) + AES_BLOCK_SIZE - 1)
+        decryptor.update_into(encrypted, decrypted)
+        decryptor.finalize()
+        del decrypted[data_len:]
 
-        _LOGGER.debug(">PLAIN " + decrypted.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(">PLAIN %s", decrypted.hex())
         return decrypted
 
 
-    def aes_encrypt(self, data: bytes, aes_key: bytes | None, iv: bytes | None):
-        message_header = int.to_bytes(len(data), 2, "big")
-
+    def aes_encrypt(self, data: bytes, aes_key: bytes | None, iv: bytes | None) -> bytearray:
+        header_len = 2
         if iv is None:
             iv_seed = os.urandom(4)
             iv = hashlib.md5(iv_seed).digest()
-            message_header += iv_seed
+            header_len += len(iv_seed)
 
         padding = (AES_BLOCK_SIZE - len(data) % AES_BLOCK_SIZE) % AES_BLOCK_SIZE
-        data += bytes(padding)
+        size = len(data) + padding
 
-        cipher = Cipher(algorithms.AES(aes_key), modes.CBC(iv))
-        encryptor = cipher.encryptor()
-        encrypted = encryptor.update(data) + encryptor.finalize()
-        encrypted = message_header + encrypted
+        # Write header and encrypted data into one buffer
+        encrypted = bytearray(header_len + size + AES_BLOCK_SIZE - 1)
+        encrypted[0:2] = len(data).to_bytes(2, "big")
+        if header_len > 2:
+            encrypted[2:header_len] = iv_seed
 
-        _LOGGER.debug("PLAIN> " + data.hex())
+        if padding:
+            data = bytes(data) + bytes(padding)
+
+        encryptor = Cipher(algorithms.AES(aes_key), modes.CBC(iv)).encryptor()
+        with memoryview(encrypted) as view:
+            encryptor.update_into(data, view[header_len:])
+        encryptor.finalize()
+        del encrypted[header_len + size :]
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("PLAIN> %s", data.hex())
         return encrypted
     
     def msg_challenge(self, message: Message) -> bytes | None:
@@ -244,22 +269,23 @@ class BluettiEncryption:
         body = bytes.fromhex("0204") + self.unsecure_aes_iv[8:12]
         return b"".join([KEX_MAGIC, body, hexsum(body, 2)])
 
-    def msg_peer_pubkey(self, message: Message) -> bytes | None:
+    def msg_peer_pubkey(self, message: Message, keypair=None) -> bytes | None:
+        """Answer the peer pubkey. Does the expensive crypto, better not run
+        it in the event loop. Pass a keypair created in advance to save the
+        key generation."""
         _LOGGER.debug("Received peer pubkey, checking signature")
         data = verify_and_extract_signed_data(message.data, self.unsecure_aes_iv)
         self.peer_pubkey = pubkey_from_bytes(data)
 
-        _LOGGER.debug("Generating a local keypair")
-        self.my_pubkey, self.my_privkey = generate_keypair()
+        if keypair is None:
+            _LOGGER.debug("Generating a local keypair")
+            keypair = generate_keypair()
+        self.my_pubkey, self.my_privkey = keypair
         my_pubkey_bytes = pubkey_to_bytes(self.my_pubkey)
 
         _LOGGER.debug("Signing the local pubkey")
-        signing_secret = int.from_bytes(
-            bytes.fromhex(PRIVATE_KEY_L1), "big"
-        )
-        signing_key = ec.derive_private_key(signing_secret, ec.SECP256R1())
         to_sign = my_pubkey_bytes + self.unsecure_aes_iv
-        signature = signing_key.sign(to_sign, ec.ECDSA(hashes.SHA256()))
+        signature = local_signing_key().sign(to_sign, ec.ECDSA(hashes.SHA256()))
         raw_signature = der_to_raw_ecdsa(signature)
 
         body = b"".join([bytes.fromhex("0580"), my_pubkey_bytes, raw_signature])
@@ -267,6 +293,7 @@ class BluettiEncryption:
         return self.aes_encrypt(msg, self.unsecure_aes_key, self.unsecure_aes_iv)
     
     def msg_key_accepted(self, message: Message) -> None:
+        """Derive the secure key (ECDH), better not run it in the event loop"""
         _LOGGER.debug("Received key exchange confirmation, calculating shared secret")
 
         if len(message.data) != 1:
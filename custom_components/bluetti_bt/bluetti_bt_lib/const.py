@@ -1,6 +1,45 @@
 """Const definitions."""
 
 RESPONSE_TIMEOUT = 2
+# Seconds the encryption key exchange may take after connecting
+HANDSHAKE_TIMEOUT = 10
+
+# Read planning: maximum registers fetched by a single ReadHoldingRegisters
+# and the cost of one extra request round-trip (GATT write + notify),
+# expressed in registers that could be read through a gap in the same time
+MAX_REGISTERS_PER_READ = 100
+READ_REQUEST_COST = 20
+
+# Requests kept in flight when pipelining is enabled
+PIPELINE_WINDOW = 4
+
+# Reads of a battery pack until the device reports it as selected, and the
+# seconds to wait after selecting it again
+PACK_SELECT_ATTEMPTS = 3
+PACK_SELECT_DELAY = 1
+# Seconds (at least, or the pack polling interval) until a pack which
+# couldn't be selected is tried again
+PACK_RETRY_INTERVAL = 60
+
+# Seconds (at least, or pack polling intervals) until data of a pack which
+# couldn't be read anymore is dropped
+PACK_DATA_TTL = 300
+PACK_DATA_TTL_INTERVALS = 3
+
+# Devices connecting or polling at once through one bluetooth adapter or
+# proxy (ESPHome proxies have 3 connection slots, one is left for other
+# integrations) and the seconds between two connection attempts on the same
+# adapter. Connections kept open between polls don't count.
+MAX_CONNECTIONS_PER_ADAPTER = 2
+CONNECTION_STAGGER = 1.0
+
+# Backoff before reconnecting, doubled on every attempt and randomized by 50%
+RECONNECT_BACKOFF = 2
+RECONNECT_BACKOFF_MAX = 30
+
+# Seconds a lingering connection is opened again before the next poll
+LINGER_CONNECT_AHEAD = 5
+
 WRITE_UUID = "0000ff02-0000-1000-8000-00805f9b34fb"
 NOTIFY_UUID = "0000ff01-0000-1000-8000-00805f9b34fb"
 DEVICE_NAME_UUID = "00002a00-0000-1000-8000-00805f9b34fb"
@@ -3,7 +3,6 @@
 from typing import List
 
 from ..field_enums import ChargingMode
-from ..utils.commands import ReadHoldingRegisters
 from ..base_devices.ProtocolV2Device import ProtocolV2Device
 
 class AC180P(ProtocolV2Device):
@@ -29,21 +28,6 @@ class AC180P(ProtocolV2Device):
         # Controls (2200)
         self.struct.add_bool_field('grid_enhancement_mode_on', 2225)
 
-    @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return super().polling_commands + [
-            ReadHoldingRegisters(140, 1),
-            ReadHoldingRegisters(142, 1),
-            ReadHoldingRegisters(144, 1),
-            ReadHoldingRegisters(146, 1),
-            ReadHoldingRegisters(1314, 1),
-            ReadHoldingRegisters(2011, 1),
-            ReadHoldingRegisters(2012, 1),
-            ReadHoldingRegisters(2020, 1),
-            ReadHoldingRegisters(2021, 1),
-            ReadHoldingRegisters(2225, 1),
-        ]
-
     @property
     def writable_ranges(self) -> List[range]:
         return super().writable_ranges + [
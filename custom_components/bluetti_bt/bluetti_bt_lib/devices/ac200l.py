@@ -1,9 +1,9 @@
 """AC200L fields."""
 
-from typing import List
+from typing import Dict, List
 
 from ..utils.commands import ReadHoldingRegisters
-from ..field_enums import AutoSleepMode, OutputMode
+from ..field_enums import AutoSleepMode, OutputMode, PollingTier
 from ..base_devices.ProtocolV1Device import ProtocolV1Device
 
 
@@ -38,11 +38,14 @@ class AC200L(ProtocolV1Device):
     def pack_num_max(self):
         return 3
 
+    def is_polled_address(self, address: int) -> bool:
+        return address <= 90 or address >= 256 # pack_polling_commands
+
     @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return self.struct.get_read_holding_registers(
-            filter=lambda address: address <= 90 or address >= 256 # pack_polling_commands
-        )
+    def polling_tiers(self) -> Dict[str, PollingTier]:
+        return super().polling_tiers | {
+            "auto_sleep_mode": PollingTier.SLOW,
+        }
 
     @property
     def writable_ranges(self) -> List[range]:
@@ -50,7 +53,7 @@ class AC200L(ProtocolV1Device):
 
     @property
     def pack_polling_commands(self) -> List[ReadHoldingRegisters]:
-        return [
-            ReadHoldingRegisters(91, 37),
-            ReadHoldingRegisters(201, 2),
-        ]
+        return self.struct.get_read_holding_registers(
+            max_registers=self.max_registers_per_read,
+            filter=lambda address: 90 < address < 256
+        )
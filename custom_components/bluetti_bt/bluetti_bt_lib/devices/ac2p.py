@@ -3,7 +3,6 @@
 from typing import List
 
 from ..base_devices.ProtocolV2Device import ProtocolV2Device
-from ..utils.commands import ReadHoldingRegisters
 
 
 class AC2P(ProtocolV2Device):
@@ -27,11 +26,6 @@ class AC2P(ProtocolV2Device):
         self.struct.add_bool_field('dc_output_on', 2012)
         self.struct.add_bool_field('power_lifting_on', 2021)
 
-    @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        # Automatically generate polling ranges based on fields defined above
-        return self.struct.get_read_holding_registers()
-
     @property
     def writable_ranges(self) -> List[range]:
         # Define if/where you want to support writing later (e.g. to toggle AC/DC outputs)
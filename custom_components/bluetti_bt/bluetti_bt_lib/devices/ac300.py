@@ -1,9 +1,15 @@
 """AC300 fields."""
 
-from typing import List
+from typing import Dict, List
 
 from ..utils.commands import ReadHoldingRegisters
-from ..field_enums import AutoSleepMode, OutputMode, SplitPhaseMachineType, UpsMode
+from ..field_enums import (
+    AutoSleepMode,
+    OutputMode,
+    PollingTier,
+    SplitPhaseMachineType,
+    UpsMode,
+)
 from ..base_devices.ProtocolV1Device import ProtocolV1Device
 
 
@@ -52,11 +58,21 @@ class AC300(ProtocolV1Device):
     def pack_num_max(self):
         return 4
 
+    def is_polled_address(self, address: int) -> bool:
+        return address <= 90 or address >= 256 # pack_polling_commands
+
     @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return self.struct.get_read_holding_registers(
-            filter=lambda address: address <= 90 or address >= 256 # pack_polling_commands
-        )
+    def polling_tiers(self) -> Dict[str, PollingTier]:
+        return super().polling_tiers | {
+            "ups_mode": PollingTier.SLOW,
+            "split_phase_on": PollingTier.SLOW,
+            "split_phase_machine_mode": PollingTier.SLOW,
+            "grid_charge_on": PollingTier.SLOW,
+            "time_control_on": PollingTier.SLOW,
+            "battery_range_start": PollingTier.SLOW,
+            "battery_range_end": PollingTier.SLOW,
+            "auto_sleep_mode": PollingTier.SLOW,
+        }
 
     @property
     def writable_ranges(self) -> List[range]:
@@ -67,7 +83,7 @@ class AC300(ProtocolV1Device):
 
     @property
     def pack_polling_commands(self) -> List[ReadHoldingRegisters]:
-        return [
-            ReadHoldingRegisters(91, 37),
-            ReadHoldingRegisters(201, 2),
-        ]
+        return self.struct.get_read_holding_registers(
+            max_registers=self.max_registers_per_read,
+            filter=lambda address: 90 < address < 256
+        )
@@ -3,7 +3,6 @@
 from typing import List
 
 from ..field_enums import ChargingMode
-from ..utils.commands import ReadHoldingRegisters
 from ..base_devices.ProtocolV2Device import ProtocolV2Device
 
 class AC60P(ProtocolV2Device):
@@ -29,10 +28,6 @@ class AC60P(ProtocolV2Device):
         # Controls (2200)
         self.struct.add_bool_field('grid_enhancement_mode_on', 2225)
 
-    @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return self.struct.get_read_holding_registers()
-
     @property
     def writable_ranges(self) -> List[range]:
         return super().writable_ranges + [
@@ -2,7 +2,6 @@
 
 from typing import List
 
-from ..utils.commands import ReadHoldingRegisters
 from ..field_enums import ChargingMode, EcoShutdown, LedMode
 from ..base_devices.ProtocolV1Device import ProtocolV1Device
 
@@ -23,10 +22,6 @@ class EB3A(ProtocolV1Device):
         self.struct.add_enum_field("charging_mode", 3065, ChargingMode)
         self.struct.add_bool_field("power_lifting_on", 3066)
 
-    @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return self.struct.get_read_holding_registers()
-
     @property
     def writable_ranges(self) -> List[range]:
         return super().writable_ranges + [
@@ -1,9 +1,15 @@
 """EP500P fields."""
 
-from typing import List
+from typing import Dict, List
 
 from ..utils.commands import ReadHoldingRegisters
-from ..field_enums import AutoSleepMode, OutputMode, SplitPhaseMachineType, UpsMode
+from ..field_enums import (
+    AutoSleepMode,
+    OutputMode,
+    PollingTier,
+    SplitPhaseMachineType,
+    UpsMode,
+)
 from ..base_devices.ProtocolV1Device import ProtocolV1Device
 
 
@@ -48,11 +54,21 @@ class EP500P(ProtocolV1Device):
         self.struct.add_uint_field("battery_range_end", 3016)
         self.struct.add_enum_field("auto_sleep_mode", 3061, AutoSleepMode)
 
+    def is_polled_address(self, address: int) -> bool:
+        return address <= 90 or address >= 256 # pack_polling_commands
+
     @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return self.struct.get_read_holding_registers(
-            filter=lambda address: address <= 90 or address >= 256 # pack_polling_commands
-        )
+    def polling_tiers(self) -> Dict[str, PollingTier]:
+        return super().polling_tiers | {
+            "ups_mode": PollingTier.SLOW,
+            "split_phase_on": PollingTier.SLOW,
+            "split_phase_machine_mode": PollingTier.SLOW,
+            "grid_charge_on": PollingTier.SLOW,
+            "time_control_on": PollingTier.SLOW,
+            "battery_range_start": PollingTier.SLOW,
+            "battery_range_end": PollingTier.SLOW,
+            "auto_sleep_mode": PollingTier.SLOW,
+        }
 
     @property
     def writable_ranges(self) -> List[range]:
@@ -63,7 +79,7 @@ class EP500P(ProtocolV1Device):
 
     @property
     def pack_polling_commands(self) -> List[ReadHoldingRegisters]:
-        return [
-            ReadHoldingRegisters(91, 37),
-            ReadHoldingRegisters(201, 2),
-        ]
+        return self.struct.get_read_holding_registers(
+            max_registers=self.max_registers_per_read,
+            filter=lambda address: 90 < address < 256
+        )
@@ -1,8 +1,8 @@
 """EP600 fields."""
 
-from typing import List
+from typing import Dict
 
-from ..utils.commands import ReadHoldingRegisters
+from ..field_enums import PollingTier
 from ..base_devices.ProtocolV2Device import ProtocolV2Device
 
 
@@ -96,5 +96,21 @@ class EP600(ProtocolV2Device):
         self.struct.add_version_field("high_voltage_module_version", 6184)  # internal
 
     @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return self.struct.get_read_holding_registers()
+    def polling_tiers(self) -> Dict[str, PollingTier]:
+        return super().polling_tiers | {
+            "battery_range_start": PollingTier.SLOW,
+            "battery_range_end": PollingTier.SLOW,
+            "max_ac_input_power": PollingTier.SLOW,
+            "max_ac_input_current": PollingTier.SLOW,
+            "max_ac_output_power": PollingTier.SLOW,
+            "max_ac_output_current": PollingTier.SLOW,
+            "total_ac_consumption": PollingTier.SLOW,
+            "total_grid_consumption": PollingTier.SLOW,
+            "total_grid_feed": PollingTier.SLOW,
+            "battery_type": PollingTier.STATIC,
+            "battery_serial_number": PollingTier.STATIC,
+            "bcu_version": PollingTier.STATIC,
+            "bmu_version": PollingTier.STATIC,
+            "safety_module_version": PollingTier.STATIC,
+            "high_voltage_module_version": PollingTier.STATIC,
+        }
@@ -2,9 +2,9 @@
 # Taken from EP600, modified to:
 # A. Hide Phases 2 and 3 as EP760 in AU is only single phase
 # B. Updated DC Solar to incorporate 3rd Input - Note: Relies on additional change to field_attributes.py
-from typing import List
+from typing import Dict, List
 
-from ..utils.commands import ReadHoldingRegisters
+from ..field_enums import PollingTier
 from ..base_devices.ProtocolV2Device import ProtocolV2Device
 
 
@@ -101,14 +101,29 @@ class EP760(ProtocolV2Device):
         self.struct.add_version_field("safety_module_version", 6181)  # internal
         self.struct.add_version_field("high_voltage_module_version", 6184)  # internal
 
+    @property
+    def polling_tiers(self) -> Dict[str, PollingTier]:
+        return super().polling_tiers | {
+            "battery_range_start": PollingTier.SLOW,
+            "battery_range_end": PollingTier.SLOW,
+            "max_ac_input_power": PollingTier.SLOW,
+            "max_ac_input_current": PollingTier.SLOW,
+            "max_ac_output_power": PollingTier.SLOW,
+            "max_ac_output_current": PollingTier.SLOW,
+            "total_ac_consumption": PollingTier.SLOW,
+            "total_grid_consumption": PollingTier.SLOW,
+            "total_grid_feed": PollingTier.SLOW,
+            "battery_type": PollingTier.STATIC,
+            "battery_serial_number": PollingTier.STATIC,
+            "bcu_version": PollingTier.STATIC,
+            "bmu_version": PollingTier.STATIC,
+            "safety_module_version": PollingTier.STATIC,
+            "high_voltage_module_version": PollingTier.STATIC,
+        }
+
     @property
     def writable_ranges(self) -> List[range]:
         return super().writable_ranges + [
             range(2022, 2023),
             range(2213,2216),
         ]
-
-
-    @property
-    def polling_commands(self) -> List[ReadHoldingRegisters]:
-        return self.struct.get_read_holding_registers()
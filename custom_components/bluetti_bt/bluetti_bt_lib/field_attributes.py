@@ -22,6 +22,16 @@ class FieldType(Enum):
 
 
 class FieldAttributes:
+    __slots__ = (
+        "type",
+        "setter",
+        "name",
+        "unit_of_measurement",
+        "device_class",
+        "state_class",
+        "options",
+    )
+
     def __init__(
         self,
         type: FieldType = FieldType.NUMERIC,
@@ -42,6 +52,8 @@ class FieldAttributes:
 
 
 class PowerFieldAttributes(FieldAttributes):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str = "",
@@ -55,6 +67,8 @@ class PowerFieldAttributes(FieldAttributes):
 
 
 class VoltageFieldAttributes(FieldAttributes):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str = "",
@@ -68,6 +82,8 @@ class VoltageFieldAttributes(FieldAttributes):
 
 
 class CurrentFieldAttributes(FieldAttributes):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str = "",
@@ -81,6 +97,8 @@ class CurrentFieldAttributes(FieldAttributes):
 
 
 class EnergyFieldAttributes(FieldAttributes):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str = "",
@@ -94,6 +112,8 @@ class EnergyFieldAttributes(FieldAttributes):
 
 
 class FrequencyFieldAttributes(FieldAttributes):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str = "",
@@ -107,6 +127,8 @@ class FrequencyFieldAttributes(FieldAttributes):
 
 
 class OutletFieldAttributes(FieldAttributes):
+    __slots__ = ()
+
     def __init__(
         self,
         name: str = "",
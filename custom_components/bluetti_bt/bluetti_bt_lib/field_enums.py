@@ -60,4 +60,10 @@ class ChargingMode(Enum):
 class BatteryState(Enum):
     STANDBY = 0
     CHARGE = 1
-    DISCHARGE = 2
\ No newline at end of file
+    DISCHARGE = 2
+
+@unique
+class PollingTier(Enum):
+    STATIC = 0  # Device info, read once
+    SLOW = 1  # Statistics and settings
+    FAST = 2  # Live values, read on every poll
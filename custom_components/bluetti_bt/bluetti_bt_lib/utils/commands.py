@@ -3,28 +3,38 @@
 # Copy of https://github.com/warhammerkid/bluetti_mqtt/blob/main/bluetti_mqtt/core/commands.py
 
 import struct
-import crcmod.predefined
 
-modbus_crc = crcmod.predefined.mkCrcFun("modbus")
+from .crc import modbus_crc
 
 
 class DeviceCommand:
+    __slots__ = ("function_code", "cmd")
+
     def __init__(self, function_code: int, data: bytes):
         self.function_code = function_code
 
-        self.cmd = bytearray(len(data) + 4)
-        self.cmd[0] = 1  # MODBUS address
-        self.cmd[1] = function_code
-        self.cmd[2:-2] = data
-        struct.pack_into("<H", self.cmd, -2, modbus_crc(self.cmd[:-2]))
+        cmd = bytearray(len(data) + 4)
+        cmd[0] = 1  # MODBUS address
+        cmd[1] = function_code
+        cmd[2:-2] = data
+        struct.pack_into("<H", cmd, -2, modbus_crc(memoryview(cmd)[:-2]))
+
+        # Encoded once, commands are reused for every poll
+        self.cmd = bytes(cmd)
 
     def response_size(self) -> int:
         """Returns the expected response size in bytes"""
         pass
 
-    def __iter__(self):
-        """Provide an iter implemention so that bytes(cmd) works"""
-        return iter(self.cmd)
+    def __bytes__(self) -> bytes:
+        """Return the encoded frame without copying"""
+        return self.cmd
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DeviceCommand) and self.cmd == other.cmd
+
+    def __hash__(self) -> int:
+        return hash(self.cmd)
 
     def is_exception_response(self, response: bytes):
         """Checks the response code to see if it's a MODBUS exception"""
@@ -33,6 +43,10 @@ class DeviceCommand:
         else:
             return response[1] == self.function_code + 0x80
 
+    def is_matching_response(self, response: bytes):
+        """Checks the header, MODBUS has no transaction ids to match on"""
+        return len(response) >= 2 and response[1] == self.function_code
+
     def is_valid_response(self, response: bytes):
         """Validates that the reponse is complete and uncorrupted"""
         if len(response) < 3:
@@ -48,6 +62,8 @@ class DeviceCommand:
 
 
 class ReadHoldingRegisters(DeviceCommand):
+    __slots__ = ("starting_address", "quantity")
+
     def __init__(self, starting_address: int, quantity: int):
         self.starting_address = starting_address
         self.quantity = quantity
@@ -60,6 +76,15 @@ class ReadHoldingRegisters(DeviceCommand):
         # 2 byte crc
         return 2 * self.quantity + 5
 
+    def is_matching_response(self, response: bytes):
+        # A response to another read has another byte count (or is at least
+        # read under another address, which can't be checked)
+        return (
+            super().is_matching_response(response)
+            and len(response) >= 3
+            and response[2] == 2 * self.quantity
+        )
+
     def parse_response(self, response: bytes):
         return bytes(response[3:-2])
 
@@ -68,6 +93,8 @@ class ReadHoldingRegisters(DeviceCommand):
 
 
 class WriteSingleRegister(DeviceCommand):
+    __slots__ = ("address", "value")
+
     def __init__(self, address: int, value: int):
         self.address = address
         self.value = value
@@ -85,6 +112,8 @@ class WriteSingleRegister(DeviceCommand):
 
 
 class WriteMultipleRegisters(DeviceCommand):
+    __slots__ = ("starting_address", "data")
+
     def __init__(self, starting_address: int, data: bytes):
         if len(data) % 2 != 0:
             raise ValueError("data size must be multiple of 2")
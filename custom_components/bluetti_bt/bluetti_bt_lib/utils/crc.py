@@ -0,0 +1,85 @@
+"""CRC16/MODBUS checksum."""
+
+import array
+import struct
+import sys
+
+MODBUS_CRC_INIT = 0xFFFF
+MODBUS_CRC_POLY = 0xA001  # 0x8005 reflected
+
+
+def _make_byte_table() -> list:
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ MODBUS_CRC_POLY if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_BYTE_TABLE = _make_byte_table()
+
+# Lookup table for two bytes at once, built on first use (128 KiB)
+_word_table: array.array | None = None
+
+
+def _get_word_table() -> array.array:
+    global _word_table
+    if _word_table is None:
+        t = _BYTE_TABLE
+        _word_table = array.array(
+            "H",
+            (
+                (c >> 8) ^ t[c & 0xFF]
+                for c in ((x >> 8) ^ t[x & 0xFF] for x in range(0x10000))
+            ),
+        )
+    return _word_table
+
+
+def _crc_words(data, crc: int = MODBUS_CRC_INIT) -> int:
+    """Pure python CRC, processing two bytes per table lookup"""
+    view = memoryview(data)
+    even = len(view) & ~1
+
+    if even:
+        table = _get_word_table()
+        for word in view[:even].cast("H"):
+            crc = table[crc ^ word]
+
+    if even != len(view):
+        crc = (crc >> 8) ^ _BYTE_TABLE[(crc ^ view[-1]) & 0xFF]
+    return crc
+
+
+def _crc_bytes(data, crc: int = MODBUS_CRC_INIT) -> int:
+    """Pure python CRC, one table lookup per byte"""
+    table = _BYTE_TABLE
+    for b in memoryview(data):
+        crc = (crc >> 8) ^ table[(crc ^ b) & 0xFF]
+    return crc
+
+
+try:
+    # Use the crcmod C extension if it happens to be installed
+    from crcmod._crcfunext import _crc16r
+
+    _PACKED_TABLE = struct.pack("256H", *_BYTE_TABLE)
+
+    def _crc_native(data, crc: int = MODBUS_CRC_INIT) -> int:
+        return _crc16r(data, crc, _PACKED_TABLE)
+
+except ImportError:
+    _crc_native = None
+
+
+# modbus_crc(data, crc=MODBUS_CRC_INIT) computes the MODBUS CRC of bytes,
+# bytearray or memoryview data. Pass the result of a previous call as crc to
+# continue the checksum over the next chunk of a message.
+if _crc_native is not None:
+    modbus_crc = _crc_native
+elif sys.byteorder == "little":
+    modbus_crc = _crc_words
+else:
+    modbus_crc = _crc_bytes
@@ -1,75 +1,72 @@
 """Device builder functions."""
 
+import importlib
 import re
 
-from ..devices.ac2a import AC2A
-from ..devices.ac2p import AC2P
-from ..devices.ac60 import AC60
-from ..devices.ac60p import AC60P
-from ..devices.ac70 import AC70
-from ..devices.ac70p import AC70P
-from ..devices.ac180 import AC180
-from ..devices.ac180p import AC180P
-from ..devices.ac200l import AC200L
-from ..devices.ac200m import AC200M
-from ..devices.ac200pl import AC200PL
-from ..devices.ac300 import AC300
-from ..devices.ac500 import AC500
-from ..devices.eb3a import EB3A
-from ..devices.ep500 import EP500
-from ..devices.ep500p import EP500P
-from ..devices.ep600 import EP600
-from ..devices.ep760 import EP760
-from ..devices.ep800 import EP800
-from ..devices.elite200v2 import Elite200V2
-
 DEVICE_NAME_RE = re.compile(
     r"^(AC2A|AC2P|AC60|AC60P|AC70|AC70P|AC180|AC180P|AC200L|AC200M|AC200PL|AC300|AC500|EB3A|EP500|EP500P|EP600|EP760|EP800|E200V2)(\d+)$"
 )
 
+# Device classes by model as (module, class name). Only the module of the
+# detected model gets imported.
+DEVICE_CLASSES = {
+    "AC2A": ("ac2a", "AC2A"),
+    "AC2P": ("ac2p", "AC2P"),
+    "AC60": ("ac60", "AC60"),
+    "AC60P": ("ac60p", "AC60P"),
+    "AC70": ("ac70", "AC70"),
+    "AC70P": ("ac70p", "AC70P"),
+    "AC180": ("ac180", "AC180"),
+    "AC180P": ("ac180p", "AC180P"),
+    "AC200L": ("ac200l", "AC200L"),
+    "AC200M": ("ac200m", "AC200M"),
+    "AC200PL": ("ac200pl", "AC200PL"),
+    "AC300": ("ac300", "AC300"),
+    "AC500": ("ac500", "AC500"),
+    "EB3A": ("eb3a", "EB3A"),
+    "EP500": ("ep500", "EP500"),
+    "EP500P": ("ep500p", "EP500P"),
+    "EP600": ("ep600", "EP600"),
+    "EP760": ("ep760", "EP760"),
+    "EP800": ("ep800", "EP800"),
+    "E200V2": ("elite200v2", "Elite200V2"),
+}
+
+# Shared device models, keyed by (model, address)
+_devices: dict = {}
+
+
+def get_device_class(model: str):
+    """Import and return the device class of a model"""
+    module_name, class_name = DEVICE_CLASSES[model]
+    module = importlib.import_module(f"..devices.{module_name}", __package__)
+    return getattr(module, class_name)
+
+
+def _device_key(address: str, name: str):
+    match = DEVICE_NAME_RE.match(name)
+    return (match[1] if match else None, address)
+
+
+def get_device(address: str, name: str):
+    """Return the shared device model, building it on first use"""
+    key = _device_key(address, name)
+
+    device = _devices.get(key)
+    if device is None:
+        device = build_device(address, name)
+        _devices[key] = device
+    return device
+
+
+def remove_device(address: str, name: str):
+    """Forget the shared device model, the next get_device builds a new one"""
+    _devices.pop(_device_key(address, name), None)
+
 
 def build_device(address: str, name: str):
     match = DEVICE_NAME_RE.match(name)
-    if match[1] == "AC2A":
-        return AC2A(address, match[2])
-    if match[1] == "AC2P":
-        return AC2P(address, match[2])
-    if match[1] == "AC60":
-        return AC60(address, match[2])
-    if match[1] == "AC60P":
-        return AC60P(address, match[2])
-    if match[1] == "AC70":
-        return AC70(address, match[2])
-    if match[1] == "AC70P":
-        return AC70P(address, match[2])
-    if match[1] == "AC180":
-        return AC180(address, match[2])
-    if match[1] == "AC180P":
-        return AC180P(address, match[2])
-    if match[1] == "AC200L":
-        return AC200L(address, match[2])
-    if match[1] == "AC200M":
-        return AC200M(address, match[2])
-    if match[1] == "AC200PL":
-        return AC200PL(address, match[2])
-    if match[1] == "AC300":
-        return AC300(address, match[2])
-    if match[1] == "AC500":
-        return AC500(address, match[2])
-    if match[1] == "EB3A":
-        return EB3A(address, match[2])
-    if match[1] == "EP500":
-        return EP500(address, match[2])
-    if match[1] == "EP500P":
-        return EP500P(address, match[2])
-    if match[1] == "EP600":
-        return EP600(address, match[2])
-    if match[1] == "EP760":
-        return EP760(address, match[2])
-    if match[1] == "EP800":
-        return EP800(address, match[2])
-    if match[1] == "E200V2":
-        return Elite200V2(address, match[2])
+    return get_device_class(match[1])(address, match[2])
 
 
 def get_type_by_bt_name(bt_name: str):
@@ -0,0 +1,64 @@
+"""Battery pack snapshots."""
+
+import time
+from typing import Dict, Tuple
+
+
+class PackSnapshot:
+    """Last values read from one battery pack"""
+
+    __slots__ = ("pack", "values", "updated_at")
+
+    def __init__(self, pack: int):
+        self.pack = pack
+        self.values: dict = {}
+        self.updated_at = 0.0
+
+    def age(self, now: float) -> float:
+        return now - self.updated_at
+
+
+class PackSnapshots:
+    """Snapshots of all battery packs of a device.
+
+    Values are published with the pack number appended to the field name.
+    Snapshots older than ttl seconds (e.g. of an unplugged pack) are dropped.
+    """
+
+    __slots__ = ("ttl", "packs", "_keys")
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.packs: Dict[int, PackSnapshot] = {}
+        # Published name per field name and pack, built only once
+        self._keys: Dict[Tuple[str, int], str] = {}
+
+    def update(self, pack: int, values: dict, now: float | None = None):
+        snapshot = self.packs.get(pack)
+        if snapshot is None:
+            snapshot = self.packs[pack] = PackSnapshot(pack)
+        snapshot.values.update(values)
+        snapshot.updated_at = time.monotonic() if now is None else now
+
+    def updated_at(self, pack: int) -> float | None:
+        snapshot = self.packs.get(pack)
+        return None if snapshot is None else snapshot.updated_at
+
+    def expire(self, now: float | None = None):
+        """Drop snapshots which weren't updated within the ttl"""
+        if now is None:
+            now = time.monotonic()
+        for pack in [p for p, s in self.packs.items() if s.age(now) > self.ttl]:
+            del self.packs[pack]
+
+    def flatten(self, into: dict, now: float | None = None) -> dict:
+        """Add the values of all fresh packs to `into`"""
+        self.expire(now)
+        keys = self._keys
+        for pack, snapshot in self.packs.items():
+            for name, value in snapshot.values.items():
+                key = keys.get((name, pack))
+                if key is None:
+                    key = keys[(name, pack)] = name + str(pack)
+                into[key] = value
+        return into
@@ -0,0 +1,45 @@
+"""Last known good values."""
+
+import time
+from typing import Dict
+
+
+class DataSnapshot:
+    """Last value read of every field and when it was read.
+
+    Values which weren't read again within ttl seconds are dropped, so a
+    failed poll is bridged with the values of the previous polls.
+    """
+
+    __slots__ = ("ttl", "values", "updated_at")
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self.values: dict = {}
+        self.updated_at: Dict[str, float] = {}
+
+    def update(self, values: dict, now: float | None = None):
+        if now is None:
+            now = time.monotonic()
+        self.values.update(values)
+        self.updated_at.update(dict.fromkeys(values, now))
+
+    def expire(self, now: float | None = None):
+        """Drop values which weren't updated within the ttl"""
+        if now is None:
+            now = time.monotonic()
+        expired = [k for k, t in self.updated_at.items() if now - t > self.ttl]
+        for key in expired:
+            del self.values[key]
+            del self.updated_at[key]
+
+    def fresh(self, now: float | None = None) -> dict:
+        """Copy of all values within the ttl"""
+        self.expire(now)
+        return self.values.copy()
+
+    def ages(self, now: float | None = None) -> Dict[str, float]:
+        """Seconds since every field was read"""
+        if now is None:
+            now = time.monotonic()
+        return {k: round(now - t, 1) for k, t in self.updated_at.items()}
@@ -4,9 +4,13 @@
 
 from decimal import Decimal
 from enum import Enum
+from ..const import MAX_REGISTERS_PER_READ, READ_REQUEST_COST
 from .commands import ReadHoldingRegisters
 import struct
-from typing import Any, List, Optional, Tuple, Type
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def swap_bytes(data: bytes):
@@ -18,6 +22,8 @@ def swap_bytes(data: bytes):
 
 
 class DeviceField:
+    __slots__ = ("name", "address", "size")
+
     def __init__(self, name: str, address: int, size: int):
         self.name = name
         self.address = address
@@ -26,29 +32,60 @@ class DeviceField:
     def parse(self, data: bytes) -> Any:
         raise NotImplementedError
 
+    def parse_word(self, val: int) -> Any:
+        """Parse a single unsigned 16-bit register (word fields only)"""
+        raise NotImplementedError
+
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        """Parse a (N, size) array of registers into one value per row"""
+        import numpy as np
+
+        values = np.empty(len(words), dtype=object)
+        for i, row in enumerate(words):
+            values[i] = self.parse(row.astype(">u2").tobytes())
+        return values
+
     def in_range(self, val: Any) -> bool:
         return True
 
+    def in_range_batch(self, values: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        return np.ones(len(values), dtype=bool)
+
 
 class UintField(DeviceField):
+    __slots__ = ("range", "multiplier")
+
     def __init__(self, name: str, address: int, range: Optional[Tuple[int, int]], multiplier: float):
         self.range = range
         self.multiplier = multiplier
         super().__init__(name, address, 1)
 
     def parse(self, data: bytes) -> int:
-        val = struct.unpack("!H", data)[0]
+        return self.parse_word(struct.unpack("!H", data)[0])
 
+    def parse_word(self, val: int) -> int:
         return val * self.multiplier
 
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        return words[:, 0] * self.multiplier
+
     def in_range(self, val: int) -> bool:
         if self.range is None:
             return True
         else:
             return val >= self.range[0] and val <= self.range[1]
 
+    def in_range_batch(self, values: "np.ndarray") -> "np.ndarray":
+        if self.range is None:
+            return super().in_range_batch(values)
+        return (values >= self.range[0]) & (values <= self.range[1])
+
 
 class IntField(DeviceField):
+    __slots__ = ("range",)
+
     def __init__(self, name: str, address: int, range: Optional[Tuple[int, int]]):
         self.range = range
         super().__init__(name, address, 1)
@@ -56,32 +93,62 @@ class IntField(DeviceField):
     def parse(self, data: bytes) -> int:
         return struct.unpack(">h", data)[0]
 
+    def parse_word(self, val: int) -> int:
+        return val - 0x10000 if val & 0x8000 else val
+
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        values = words[:, 0]
+        return values - ((values & 0x8000) << 1)
+
     def in_range(self, val: int) -> bool:
         if self.range is None:
             return True
         else:
             return val >= self.range[0] and val <= self.range[1]
 
+    def in_range_batch(self, values: "np.ndarray") -> "np.ndarray":
+        if self.range is None:
+            return super().in_range_batch(values)
+        return (values >= self.range[0]) & (values <= self.range[1])
+
 
 class BoolField(DeviceField):
+    __slots__ = ()
+
     def __init__(self, name: str, address: int):
         super().__init__(name, address, 1)
 
     def parse(self, data: bytes) -> bool:
-        return struct.unpack("!H", data)[0] == 1
+        return self.parse_word(struct.unpack("!H", data)[0])
+
+    def parse_word(self, val: int) -> bool:
+        return val == 1
+
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        return words[:, 0] == 1
 
 
 class EnumField(DeviceField):
+    __slots__ = ("enum",)
+
     def __init__(self, name: str, address: int, enum: Type[Enum]):
         self.enum = enum
         super().__init__(name, address, 1)
 
     def parse(self, data: bytes) -> Any:
-        val = struct.unpack("!H", data)[0]
+        return self.parse_word(struct.unpack("!H", data)[0])
+
+    def parse_word(self, val: int) -> Any:
         return self.enum(val)
 
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        # Raw enum values, map with self.enum where needed
+        return words[:, 0]
+
 
 class DecimalField(DeviceField):
+    __slots__ = ("scale", "range", "multiplier")
+
     def __init__(
         self, name: str, address: int, scale: int, range: Optional[Tuple[int, int]], multiplier: float
     ):
@@ -91,8 +158,14 @@ class DecimalField(DeviceField):
         super().__init__(name, address, 1)
 
     def parse(self, data: bytes) -> Decimal:
-        val = Decimal(struct.unpack("!H", data)[0])
-        return (val / 10 ** self.scale) * Decimal(self.multiplier)
+        return self.parse_word(struct.unpack("!H", data)[0])
+
+    def parse_word(self, val: int) -> Decimal:
+        return (Decimal(val) / 10 ** self.scale) * Decimal(self.multiplier)
+
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        # float64 instead of Decimal
+        return (words[:, 0] / 10 ** self.scale) * self.multiplier
 
     def in_range(self, val: Decimal) -> bool:
         if self.range is None:
@@ -100,8 +173,15 @@ class DecimalField(DeviceField):
         else:
             return val >= self.range[0] and val <= self.range[1]
 
+    def in_range_batch(self, values: "np.ndarray") -> "np.ndarray":
+        if self.range is None:
+            return super().in_range_batch(values)
+        return (values >= self.range[0]) & (values <= self.range[1])
+
 
 class DecimalArrayField(DeviceField):
+    __slots__ = ("scale",)
+
     def __init__(self, name: str, address: int, size: int, scale: int):
         self.scale = scale
         super().__init__(name, address, size)
@@ -110,10 +190,16 @@ class DecimalArrayField(DeviceField):
         values = list(struct.unpack(f"!{self.size}H", data))
         return [Decimal(v) / 10 ** self.scale for v in values]
 
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        # (N, size) float64 instead of lists of Decimal
+        return words / 10 ** self.scale
+
 
 class StringField(DeviceField):
     """Fixed-width null-terminated string field"""
 
+    __slots__ = ()
+
     def parse(self, data: bytes) -> str:
         try:
             return data.rstrip(b"\0").decode("ascii")
@@ -124,6 +210,8 @@ class StringField(DeviceField):
 class SwapStringField(DeviceField):
     """Fixed-width null-terminated string field"""
 
+    __slots__ = ()
+
     def parse(self, data: bytes) -> str:
         try:
             return swap_bytes(data).rstrip(b"\0").decode("ascii")
@@ -132,6 +220,8 @@ class SwapStringField(DeviceField):
 
 
 class VersionField(DeviceField):
+    __slots__ = ()
+
     def __init__(self, name: str, address: int):
         super().__init__(name, address, 2)
 
@@ -139,8 +229,13 @@ class VersionField(DeviceField):
         values = struct.unpack("!2H", data)
         return Decimal(values[0] + (values[1] << 16)) / 100
 
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        return (words[:, 0] + (words[:, 1] << 16)) / 100
+
 
 class SerialNumberField(DeviceField):
+    __slots__ = ()
+
     def __init__(self, name: str, address: int):
         super().__init__(name, address, 4)
 
@@ -148,97 +243,238 @@ class SerialNumberField(DeviceField):
         values = struct.unpack("!4H", data)
         return values[0] + (values[1] << 16) + (values[2] << 32) + (values[3] << 48)
 
+    def parse_batch(self, words: "np.ndarray") -> "np.ndarray":
+        import numpy as np
+
+        values = words.astype(np.uint64)
+        return (
+            values[:, 0]
+            + (values[:, 1] << np.uint64(16))
+            + (values[:, 2] << np.uint64(32))
+            + (values[:, 3] << np.uint64(48))
+        )
+
+
+WORD_FIELD_TYPES = (UintField, IntField, BoolField, EnumField, DecimalField)
+
+
+class ParsePlan:
+    """Precompiled parser for a single register block.
+
+    All single-register fields are unpacked with one precompiled
+    `struct.Struct`, the remaining fields are parsed from their byte offset.
+    """
+
+    __slots__ = ("words", "entries")
+
+    def __init__(self, fields: List[DeviceField], starting_address: int, quantity: int):
+        r = range(starting_address, starting_address + quantity)
+        fields = [f for f in fields if f.address in r and f.address + f.size - 1 in r]
+
+        # Word index in the unpacked tuple for every register holding a word field
+        word_addresses = sorted(
+            {f.address for f in fields if isinstance(f, WORD_FIELD_TYPES)}
+        )
+        word_index = {a: i for i, a in enumerate(word_addresses)}
+
+        fmt = ">"
+        position = starting_address
+        for address in word_addresses:
+            if address > position:
+                fmt += f"{2 * (address - position)}x"
+            fmt += "H"
+            position = address + 1
+        self.words = struct.Struct(fmt) if word_addresses else None
+
+        # (field, word index, byte offset) in field order
+        self.entries = [
+            (
+                f,
+                word_index.get(f.address) if isinstance(f, WORD_FIELD_TYPES) else None,
+                2 * (f.address - starting_address),
+            )
+            for f in fields
+        ]
+
+    def parse(self, data: bytes) -> dict:
+        words = self.words.unpack_from(data) if self.words is not None else ()
+
+        parsed = {}
+        for f, index, offset in self.entries:
+            if index is not None:
+                val = f.parse_word(words[index])
+            else:
+                val = f.parse(data[offset : offset + 2 * f.size])
+
+            # Skip if the value is "out-of-range" - sometimes the sensors
+            # report weird values
+            if not f.in_range(val):
+                continue
+
+            parsed[f.name] = val
+
+        return parsed
+
 
 class DeviceStruct:
     fields: List[DeviceField]
 
     def __init__(self):
         self.fields = []
+        # All fields with a given name, in the order they were added
+        self.fields_by_name: Dict[str, List[DeviceField]] = {}
+        self._parse_plans: Dict[Tuple[int, int], ParsePlan] = {}
+
+    def _add_field(self, field: DeviceField):
+        self.fields.append(field)
+        self.fields_by_name.setdefault(field.name, []).append(field)
+        # Field list changed, compiled parse plans are outdated
+        self._parse_plans.clear()
 
     def add_uint_field(self, name: str, address: int, range: Tuple[int, int] = None, multiplier: float = 1):
-        self.fields.append(UintField(name, address, range, multiplier))
+        self._add_field(UintField(name, address, range, multiplier))
 
     def add_int_field(self, name: str, address: int, range: Tuple[int, int] = None):
-        self.fields.append(IntField(name, address, range))
+        self._add_field(IntField(name, address, range))
 
     def add_bool_field(self, name: str, address: int):
-        self.fields.append(BoolField(name, address))
+        self._add_field(BoolField(name, address))
 
     def add_enum_field(self, name: str, address: int, enum: Type[Enum]):
-        self.fields.append(EnumField(name, address, enum))
+        self._add_field(EnumField(name, address, enum))
 
     def add_decimal_field(
         self, name: str, address: int, scale: int, range: Tuple[int, int] = None, multiplier: float = 1
     ):
-        self.fields.append(DecimalField(name, address, scale, range, multiplier))
+        self._add_field(DecimalField(name, address, scale, range, multiplier))
 
     def add_decimal_array_field(self, name: str, address: int, size: int, scale: int):
-        self.fields.append(DecimalArrayField(name, address, size, scale))
+        self._add_field(DecimalArrayField(name, address, size, scale))
 
     def add_string_field(self, name: str, address: int, size: int):
-        self.fields.append(StringField(name, address, size))
+        self._add_field(StringField(name, address, size))
 
     def add_swap_string_field(self, name: str, address: int, size: int):
-        self.fields.append(SwapStringField(name, address, size))
+        self._add_field(SwapStringField(name, address, size))
 
     def add_version_field(self, name: str, address: int):
-        self.fields.append(VersionField(name, address))
+        self._add_field(VersionField(name, address))
 
     def add_sn_field(self, name: str, address: int):
-        self.fields.append(SerialNumberField(name, address))
+        self._add_field(SerialNumberField(name, address))
         
-    def get_read_holding_registers(self, tolerance=20, filter=lambda address: True):
-        address_set = set()
-        for field in self.fields:
-            for address in range(field.address, field.address + field.size):
-                address_set.add(address)
-        # Filter out addresses that we specificly 
-        # specified to exclude.
-        for address in set(address_set):
-            if not filter(address):
-                address_set.remove(address)
+    def get_read_holding_registers(
+        self,
+        max_registers: int = MAX_REGISTERS_PER_READ,
+        request_cost: int = READ_REQUEST_COST,
+        filter=lambda address: True,
+        fields: Iterable[DeviceField] | None = None,
+    ) -> List[ReadHoldingRegisters]:
+        """Plan the cheapest set of reads covering all fields (or `fields`).
+
+        Every read costs `request_cost` plus the registers it returns, so two
+        field groups are merged whenever reading through the gap between them
+        is cheaper than an extra round-trip. Fields are never split and no
+        read exceeds `max_registers` (unless a single field is larger).
+        """
+        # Collect the register spans of all fields, dropping addresses we
+        # specificly specified to exclude.
+        spans = []
+        for field in self.fields if fields is None else fields:
+            addresses = [
+                a for a in range(field.address, field.address + field.size) if filter(a)
+            ]
+            if addresses:
+                spans.append((addresses[0], addresses[-1]))
         # Fast path: no addresses -> no commands.
-        if not address_set:
+        if not spans:
             return []
-        
-        commands = []
 
-        address_list = sorted(address_set)
-        start = address_list[0]
-        last = address_list[0]
-        for address in address_list[1:]:
-            # Create a new group if there's a gap 
-            # in the addresses.
-            if address >= last + tolerance:
-                commands.append(ReadHoldingRegisters(start, last - start + 1))
-                start = address
-            last = address
-        commands.append(ReadHoldingRegisters(start, last - start + 1))    
-        return commands
+        # Merge overlapping spans into atoms which can't be split
+        atoms = []
+        for start, end in sorted(spans):
+            if atoms and start <= atoms[-1][1]:
+                atoms[-1][1] = max(atoms[-1][1], end)
+            else:
+                atoms.append([start, end])
+
+        # cost[i] is the cheapest plan covering atoms[:i], split[i] the
+        # first atom of the last read in that plan
+        cost = [0] + [None] * len(atoms)
+        split = [0] * (len(atoms) + 1)
+        for i in range(1, len(atoms) + 1):
+            end = atoms[i - 1][1]
+            for j in range(i - 1, -1, -1):
+                quantity = end - atoms[j][0] + 1
+                if j < i - 1 and quantity > max_registers:
+                    break
+                candidate = cost[j] + request_cost + quantity
+                if cost[i] is None or candidate < cost[i]:
+                    cost[i] = candidate
+                    split[i] = j
 
-    def parse(self, starting_address: int, data: bytes) -> dict:
-        # Offsets and size are counted in 2 byte chunks, so for the range we
-        # need to divide the byte size by 2
-        data_size = int(len(data) / 2)
+        commands = []
+        i = len(atoms)
+        while i > 0:
+            j = split[i]
+            start = atoms[j][0]
+            commands.append(ReadHoldingRegisters(start, atoms[i - 1][1] - start + 1))
+            i = j
+        commands.reverse()
+        return commands
 
-        # Filter out fields not in range
-        r = range(starting_address, starting_address + data_size)
-        fields = [
-            f for f in self.fields if f.address in r and f.address + f.size - 1 in r
-        ]
+    def _get_parse_plan(self, starting_address: int, quantity: int) -> ParsePlan:
+        key = (starting_address, quantity)
 
-        # Parse fields
-        parsed = {}
-        for f in fields:
-            data_start = 2 * (f.address - starting_address)
-            field_data = data[data_start : data_start + 2 * f.size]
-            val = f.parse(field_data)
+        plan = self._parse_plans.get(key)
+        if plan is None:
+            plan = ParsePlan(self.fields, starting_address, quantity)
+            self._parse_plans[key] = plan
 
-            # Skip if the value is "out-of-range" - sometimes the sensors
-            # report weird values
-            if not f.in_range(val):
-                continue
-
-            parsed[f.name] = val
+        return plan
 
-        return parsed
+    def parse(self, starting_address: int, data: bytes) -> dict:
+        # Offsets and size are counted in 2 byte chunks, so for the range we
+        # need to divide the byte size by 2
+        plan = self._get_parse_plan(starting_address, len(data) // 2)
+        return plan.parse(data)
+
+    def parse_batch(self, starting_address: int, bodies: Sequence[bytes]) -> dict:
+        """Decode the register data of many reads of the same block in one pass.
+
+        Every entry of bodies holds the registers starting at
+        starting_address, two big-endian bytes each, as returned by
+        ReadHoldingRegisters.parse_response(): without the MODBUS address,
+        function code and byte count header and without the CRC. All
+        entries must have the same even length.
+
+        Returns one numpy masked array per field, with one row per entry.
+        Values outside the field range are masked, matching what parse()
+        skips. Decimal fields are returned as float64, enums as raw values.
+        Needs numpy, which is not required by the integration itself.
+        """
+        import numpy as np
+
+        buffer = b"".join(bodies)
+        if not bodies or len(buffer) != len(bodies) * len(bodies[0]):
+            raise ValueError("bodies must be non-empty and of equal size")
+
+        quantity = len(bodies[0]) // 2
+        words = (
+            np.frombuffer(buffer, dtype=">u2")
+            .reshape(len(bodies), quantity)
+            .astype(np.int64)
+        )
+
+        plan = self._get_parse_plan(starting_address, quantity)
+
+        columns = {}
+        for f, _, offset in plan.entries:
+            index = offset // 2
+            values = f.parse_batch(words[:, index : index + f.size])
+            mask = ~f.in_range_batch(values)
+            if values.ndim > 1:
+                mask = np.repeat(mask[:, None], values.shape[1], axis=1)
+            columns[f.name] = np.ma.MaskedArray(values, mask=mask)
+
+        return columns
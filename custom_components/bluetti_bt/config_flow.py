@@ -22,11 +22,17 @@ from .bluetti_bt_lib.utils.device_builder import get_type_by_bt_name
 from .bluetti_bt_lib.bluetooth.device_recognizer import recognize_device
 
 from .const import (
+    CONF_DATA_TTL,
     CONF_ENCRYPTION,
+    CONF_LINGER_TIME,
+    CONF_MAX_POLLING_INTERVAL,
     CONF_MAX_RETRIES,
+    CONF_PACK_POLLING_INTERVAL,
     CONF_PERSISTENT_CONN,
+    CONF_PIPELINED,
     CONF_POLLING_INTERVAL,
     CONF_POLLING_TIMEOUT,
+    CONF_SLOW_POLLING_INTERVAL,
     CONF_USE_CONTROLS,
     DOMAIN,
 )
@@ -150,7 +156,28 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
             if not user_input[CONF_PERSISTENT_CONN] and user_input[CONF_POLLING_INTERVAL] < 5:
                 return self.async_abort(reason="invalid_interval")
+
+            if user_input[CONF_LINGER_TIME] < 0:
+                return self.async_abort(reason="invalid_linger_time")
+
+            # Statistics are read at least on every poll
+            user_input[CONF_SLOW_POLLING_INTERVAL] = max(
+                user_input[CONF_SLOW_POLLING_INTERVAL],
+                user_input[CONF_POLLING_INTERVAL],
+            )
+
+            # The interval never adapts below the polling interval
+            user_input[CONF_MAX_POLLING_INTERVAL] = max(
+                user_input[CONF_MAX_POLLING_INTERVAL],
+                user_input[CONF_POLLING_INTERVAL],
+            )
+
+            if user_input[CONF_PACK_POLLING_INTERVAL] < 0:
+                return self.async_abort(reason="invalid_pack_interval")
             
+            if user_input[CONF_DATA_TTL] < 0:
+                return self.async_abort(reason="invalid_data_ttl")
+
             # Validate update timeout
             if user_input[CONF_POLLING_TIMEOUT] < 1:
                 return self.async_abort(reason="invalid_timeout")
@@ -166,10 +193,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     **{
                         CONF_USE_CONTROLS: user_input[CONF_USE_CONTROLS],
                         CONF_PERSISTENT_CONN: user_input[CONF_PERSISTENT_CONN],
+                        CONF_LINGER_TIME: user_input[CONF_LINGER_TIME],
                         CONF_POLLING_INTERVAL: user_input[CONF_POLLING_INTERVAL],
+                        CONF_MAX_POLLING_INTERVAL: user_input[CONF_MAX_POLLING_INTERVAL],
+                        CONF_SLOW_POLLING_INTERVAL: user_input[CONF_SLOW_POLLING_INTERVAL],
+                        CONF_PACK_POLLING_INTERVAL: user_input[CONF_PACK_POLLING_INTERVAL],
+                        CONF_DATA_TTL: user_input[CONF_DATA_TTL],
                         CONF_POLLING_TIMEOUT: user_input[CONF_POLLING_TIMEOUT],
                         CONF_MAX_RETRIES: user_input[CONF_MAX_RETRIES],
                         CONF_ENCRYPTION: user_input[CONF_ENCRYPTION],
+                        CONF_PIPELINED: user_input[CONF_PIPELINED],
                     },
                 },
             )
@@ -178,10 +211,16 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 data={
                     CONF_USE_CONTROLS: user_input[CONF_USE_CONTROLS],
                     CONF_PERSISTENT_CONN: user_input[CONF_PERSISTENT_CONN],
+                    CONF_LINGER_TIME: user_input[CONF_LINGER_TIME],
                     CONF_POLLING_INTERVAL: user_input[CONF_POLLING_INTERVAL],
+                    CONF_MAX_POLLING_INTERVAL: user_input[CONF_MAX_POLLING_INTERVAL],
+                    CONF_SLOW_POLLING_INTERVAL: user_input[CONF_SLOW_POLLING_INTERVAL],
+                    CONF_PACK_POLLING_INTERVAL: user_input[CONF_PACK_POLLING_INTERVAL],
+                    CONF_DATA_TTL: user_input[CONF_DATA_TTL],
                     CONF_POLLING_TIMEOUT: user_input[CONF_POLLING_TIMEOUT],
                     CONF_MAX_RETRIES: user_input[CONF_MAX_RETRIES],
                     CONF_ENCRYPTION: user_input[CONF_ENCRYPTION],
+                    CONF_PIPELINED: user_input[CONF_PIPELINED],
                 },
             )
 
@@ -197,10 +236,36 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_PERSISTENT_CONN,
                         default=self.config_entry.data.get(CONF_PERSISTENT_CONN, False),
                     ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_LINGER_TIME,
+                        default=self.config_entry.data.get(CONF_LINGER_TIME, 0),
+                    ): int,
                     vol.Required(
                         CONF_POLLING_INTERVAL,
                         default=self.config_entry.data.get(CONF_POLLING_INTERVAL, 20),
                     ): int,
+                    vol.Required(
+                        CONF_MAX_POLLING_INTERVAL,
+                        default=self.config_entry.data.get(
+                            CONF_MAX_POLLING_INTERVAL,
+                            self.config_entry.data.get(CONF_POLLING_INTERVAL, 20),
+                        ),
+                    ): int,
+                    vol.Required(
+                        CONF_SLOW_POLLING_INTERVAL,
+                        default=self.config_entry.data.get(
+                            CONF_SLOW_POLLING_INTERVAL,
+                            max(300, self.config_entry.data.get(CONF_POLLING_INTERVAL, 20)),
+                        ),
+                    ): int,
+                    vol.Required(
+                        CONF_PACK_POLLING_INTERVAL,
+                        default=self.config_entry.data.get(CONF_PACK_POLLING_INTERVAL, 60),
+                    ): int,
+                    vol.Required(
+                        CONF_DATA_TTL,
+                        default=self.config_entry.data.get(CONF_DATA_TTL, 0),
+                    ): int,
                     vol.Required(
                         CONF_POLLING_TIMEOUT,
                         default=self.config_entry.data.get(CONF_POLLING_TIMEOUT, 45),
@@ -213,6 +278,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_ENCRYPTION,
                         default=self.config_entry.data.get(CONF_ENCRYPTION, False),
                     ): selector.BooleanSelector(),
+                    vol.Required(
+                        CONF_PIPELINED,
+                        default=self.config_entry.data.get(CONF_PIPELINED, False),
+                    ): selector.BooleanSelector(),
                 }
             ),
         )
@@ -6,13 +6,20 @@ MANUFACTURER = "Bluetti"
 CONF_OPTIONS = "options"
 CONF_USE_CONTROLS = "use_controls"
 CONF_PERSISTENT_CONN = "persistent_conn"
+CONF_LINGER_TIME = "linger_time"
 CONF_POLLING_INTERVAL = "polling_interval"
 CONF_POLLING_TIMEOUT = "polling_timeout"
 CONF_MAX_RETRIES = "max_retries"
 CONF_ENCRYPTION = "use_encryption"
+CONF_PIPELINED = "pipelined"
+CONF_SLOW_POLLING_INTERVAL = "slow_polling_interval"
+CONF_MAX_POLLING_INTERVAL = "max_polling_interval"
+CONF_PACK_POLLING_INTERVAL = "pack_polling_interval"
+CONF_DATA_TTL = "data_ttl"
 
 DATA_COORDINATOR = "coordinator"
 DATA_POLLING_RUNNING = "polling_running"
+DATA_SCHEDULER = "scheduler"
 
 SUPPORTED_MODELS = [
     "AC2A",
@@ -3,24 +3,39 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from numbers import Number
 import logging
-import asyncio
+import time
 
 from bleak import BleakClient
 
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
+    UpdateFailed,
 )
 
+from .bluetti_bt_lib.bluetooth.connection_scheduler import ConnectionScheduler
 from .bluetti_bt_lib.bluetooth.device_reader import DeviceReader
-from .bluetti_bt_lib.utils.device_builder import build_device
+from .bluetti_bt_lib.const import PIPELINE_WINDOW
+from .bluetti_bt_lib.field_attributes import FIELD_ATTRIBUTES
+from .bluetti_bt_lib.field_enums import PollingTier
+from .bluetti_bt_lib.utils.device_builder import get_device
+from .bluetti_bt_lib.utils.snapshot import DataSnapshot
 
 from .utils import mac_loggable
 
 _LOGGER = logging.getLogger(__name__)
 
+# Poll at the configured interval while a power value changes by at least
+# this many watts between polls, or starts or stops
+POWER_CHANGE_THRESHOLD = 50
+# The device is idle while all power values are at most this many watts
+IDLE_POWER_THRESHOLD = 10
+
+_MISSING = object()
+
 
 class PollingCoordinator(DataUpdateCoordinator):
     """Polling coordinator."""
@@ -35,6 +50,13 @@ class PollingCoordinator(DataUpdateCoordinator):
         polling_timeout: int,
         max_retries: int,
         encrypted: bool,
+        pipelined: bool = False,
+        slow_polling_interval: int = 300,
+        max_polling_interval: int | None = None,
+        pack_polling_interval: int = 60,
+        scheduler: ConnectionScheduler | None = None,
+        linger_time: int = 0,
+        data_ttl: int = 0,
     ):
         """Initialize coordinator."""
         super().__init__(
@@ -45,7 +67,47 @@ class PollingCoordinator(DataUpdateCoordinator):
         )
 
         self.address = address
+        # The update interval adapts between these bounds
+        self.polling_interval = polling_interval
+        self.max_polling_interval = max(
+            polling_interval, max_polling_interval or polling_interval
+        )
+        self.interval_reason = "initial"
         self._device_unavailable_logged = False
+        # Data the entities were last updated with
+        self.dispatched_data: dict | None = None
+
+        # Device model shared with all platforms
+        self.bluetti_device = get_device(address, device_name)
+
+        # Static fields are read once and slow fields every
+        # slow_polling_interval seconds, their last values are added to every
+        # update
+        self.slow_polling_interval = slow_polling_interval
+        self.polling_tiers = self.bluetti_device.polling_tiers
+        self.tier_data: dict = {}
+        self.static_read = False
+        self.slow_read_at: float | None = None
+
+        # Last values of every field, a failed poll is bridged with the values
+        # of the last data_ttl seconds
+        self.snapshot = DataSnapshot(data_ttl)
+
+        # Power values deciding about the update interval
+        self.power_fields = [
+            name
+            for name in self.bluetti_device.struct.fields_by_name
+            if name in FIELD_ATTRIBUTES
+            and FIELD_ATTRIBUTES[name].device_class == "power"
+        ]
+        self.last_power: dict = {}
+        # Read first and published right away
+        self.priority_fields = self.power_fields + [
+            name
+            for name in self.bluetti_device.struct.fields_by_name
+            if name in FIELD_ATTRIBUTES
+            and FIELD_ATTRIBUTES[name].device_class == "battery"
+        ]
 
         # Create client
         self.logger.debug("Creating client")
@@ -54,11 +116,10 @@ class PollingCoordinator(DataUpdateCoordinator):
             self.logger.error("Device %s not available", mac_loggable(address))
             return None
         client = BleakClient(device)
-        bluetti_device = build_device(address, device_name)
 
         self.reader = DeviceReader(
             client,
-            bluetti_device,
+            self.bluetti_device,
             self.hass.loop.create_future,
             ble_device=device,
             device_name=device.name or device_name,            
@@ -66,7 +127,72 @@ class PollingCoordinator(DataUpdateCoordinator):
             polling_timeout=polling_timeout,
             max_retries=max_retries,
             encrypted=encrypted,
+            pipeline_window=PIPELINE_WINDOW if pipelined else 1,
+            pack_polling_interval=pack_polling_interval,
+            scheduler=scheduler,
+            linger_time=linger_time,
+            priority_fields=self.priority_fields,
         )
+        self.reader.disconnected_callback = self._async_handle_disconnect
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Follow the advertisements of the device, returns the unsubscribe"""
+        unsubscribes = [
+            bluetooth.async_register_callback(
+                self.hass,
+                self._async_handle_advertisement,
+                bluetooth.BluetoothCallbackMatcher(
+                    address=self.address, connectable=True
+                ),
+                bluetooth.BluetoothScanningMode.PASSIVE,
+            ),
+            bluetooth.async_track_unavailable(
+                self.hass, self._async_handle_unavailable, self.address, connectable=True
+            ),
+        ]
+
+        @callback
+        def _unsubscribe():
+            for unsubscribe in unsubscribes:
+                unsubscribe()
+
+        return _unsubscribe
+
+    @callback
+    def _async_handle_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ):
+        """Poll right away when the device is back"""
+        # Connect through the adapter or proxy which sees the device now
+        self.reader.ble_device = service_info.device
+        if not self.reader.client.is_connected:
+            self.reader.adapter = service_info.source
+
+        if self._device_unavailable_logged:
+            if not self.reader.polling_lock.locked():
+                self.logger.debug("Device advertising again, polling")
+                self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _async_handle_unavailable(self, service_info: bluetooth.BluetoothServiceInfoBleak):
+        """Mark the entities unavailable unless the last values are kept"""
+        if not self._device_unavailable_logged:
+            self.logger.warning("Device not connected")
+            self._device_unavailable_logged = True
+        if self.snapshot.fresh(time.monotonic()):
+            return
+        self.last_update_success = False
+        self.async_update_listeners()
+
+    @callback
+    def _async_handle_disconnect(self):
+        """Reconnect a lost persistent connection right away"""
+        if self.reader.persistent_conn:
+            self.logger.debug("Connection lost, reconnecting")
+            self.hass.async_create_task(self.async_request_refresh())
 
     async def _async_update_data(self):
         """Fetch data from API endpoint.
@@ -80,12 +206,172 @@ class PollingCoordinator(DataUpdateCoordinator):
             if not self._device_unavailable_logged:
                 self.logger.warning("Device not connected")
                 self._device_unavailable_logged = True
-            self.last_update_success = False
-            await asyncio.sleep(5)
-            return None
+            # Polled again as soon as the device advertises, see async_start
+            values = self.snapshot.fresh(time.monotonic())
+            if not values:
+                raise UpdateFailed("Device not present")
+            return self.tier_data | values
         
         if self._device_unavailable_logged:
             self.logger.info("Device reconnected and back online")
             self._device_unavailable_logged = False
 
-        return await self.reader.read_data()
+        # Connection slots are counted per adapter or proxy the device is seen by
+        service_info = bluetooth.async_last_service_info(
+            self.hass, self.address, connectable=True
+        )
+        if service_info is not None:
+            self.reader.adapter = service_info.source
+            self.reader.ble_device = service_info.device
+
+        self.reader.set_demand(self._demanded_fields())
+        tiers = self._due_tiers()
+        data = await self.reader.read_data(
+            tiers=tiers, on_data=self._async_publish_values
+        )
+        now = time.monotonic()
+        if data is not None:
+            self.snapshot.update(data, now)
+        values = self.snapshot.fresh(now)
+
+        if data is None:
+            self.reader.schedule_linger(self.update_interval.total_seconds())
+            if not values:
+                return None
+            self.logger.debug("Polling failed, keeping last values")
+            return self.tier_data | values
+
+        read_tiers = {self.polling_tiers[k] for k in data if k in self.polling_tiers}
+        if PollingTier.STATIC in read_tiers:
+            self.static_read = True
+        if PollingTier.SLOW in read_tiers:
+            self.slow_read_at = time.monotonic()
+
+        self.tier_data.update(
+            {k: v for k, v in data.items() if k in self.polling_tiers}
+        )
+        self._adapt_interval(data)
+        self.reader.schedule_linger(self.update_interval.total_seconds())
+        return self.tier_data | values
+
+    @callback
+    def _async_publish_values(self, values: dict):
+        """Publish the values of one command while the poll goes on"""
+        self.data = (self.data or self.tier_data) | values
+        self.async_update_listeners()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the entities whose value changed.
+
+        Entities register their field name as context. Listeners without a
+        context get every update, all entities get failed updates, updates
+        without data and the first update after them.
+        """
+        data = self.data if isinstance(self.data, dict) else None
+        if not self.last_update_success:
+            data = None
+        previous = self.dispatched_data
+        self.dispatched_data = data
+        if data is None or previous is None:
+            super().async_update_listeners()
+            return
+
+        changed = {k for k, v in data.items() if previous.get(k, _MISSING) != v}
+        changed.update(previous.keys() - data.keys())
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    def _adapt_interval(self, data: dict):
+        """Poll faster while power values change and slower while idle"""
+        if self.max_polling_interval == self.polling_interval:
+            self.interval_reason = "fixed"
+            return
+
+        # Some power fields are Decimal, bool and enum values are no power
+        power = {
+            k: data[k]
+            for k in self.power_fields
+            if isinstance(data.get(k), Number) and not isinstance(data[k], bool)
+        }
+        if not power:
+            # Nothing to decide on, e.g. a failed read
+            return
+
+        changed = [
+            k
+            for k, v in power.items()
+            if k in self.last_power
+            and (
+                abs(v - self.last_power[k]) >= POWER_CHANGE_THRESHOLD
+                or (v == 0) != (self.last_power[k] == 0)
+            )
+        ]
+        self.last_power.update(power)
+
+        interval = self.update_interval.total_seconds()
+        if changed:
+            interval = self.polling_interval
+            reason = "power changing: " + ", ".join(changed)
+        elif all(abs(v) <= IDLE_POWER_THRESHOLD for v in power.values()):
+            interval = interval * 2
+            reason = "idle"
+        else:
+            # Only an idle device backs off, slow changes under load are
+            # still read at the polling interval
+            interval = self.polling_interval
+            reason = "under load"
+        interval = min(interval, self.max_polling_interval)
+
+        if interval != self.update_interval.total_seconds():
+            self.logger.debug("Polling every %ss (%s)", interval, reason)
+            self.update_interval = timedelta(seconds=interval)
+        self.interval_reason = reason
+
+    def polling_diagnostics(self) -> dict:
+        """Current polling schedule"""
+        return {
+            "update_interval": self.update_interval.total_seconds(),
+            "interval_reason": self.interval_reason,
+            "polling_interval": self.polling_interval,
+            "max_polling_interval": self.max_polling_interval,
+            "slow_polling_interval": self.slow_polling_interval,
+            "linger_time": self.reader.linger_time,
+            "polled_fields": None
+            if self.reader.demand is None
+            else sorted(self.reader.demand),
+            "registers_per_poll": sum(c.quantity for c in self.reader.polling_commands),
+            "data_ttl": self.snapshot.ttl,
+            "data_age": self.snapshot.ages(),
+            "adapter": self.reader.adapter,
+            "connection_slot": self.reader.scheduler.diagnostics(self.address)
+            if self.reader.scheduler is not None
+            else None,
+        }
+
+    def _demanded_fields(self) -> set[str] | None:
+        """Fields of the enabled entities and the fields used internally.
+
+        Enabled entities are the listeners with a field name as context,
+        disabling an entity removes its listener, enabling one reloads the
+        entry. Returns None (poll all) before the entities are added.
+        """
+        fields = set(self.async_contexts())
+        if not fields:
+            return None
+        if self.max_polling_interval > self.polling_interval:
+            fields.update(self.power_fields)
+        return fields
+
+    def _due_tiers(self) -> list[PollingTier]:
+        """Tiers which have to be read in this update"""
+        tiers = [PollingTier.FAST]
+        if not self.static_read:
+            tiers.append(PollingTier.STATIC)
+        if (
+            self.slow_read_at is None
+            or time.monotonic() - self.slow_read_at >= self.slow_polling_interval
+        ):
+            tiers.append(PollingTier.SLOW)
+        return tiers
@@ -0,0 +1,30 @@
+"""Diagnostics support for Bluetti BT."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_ADDRESS, CONF_NAME
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_COORDINATOR, DOMAIN
+from .coordinator import PollingCoordinator
+
+# The BLE name contains the serial number
+TO_REDACT = {CONF_ADDRESS, CONF_NAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: PollingCoordinator = hass.data[DOMAIN][entry.entry_id][
+        DATA_COORDINATOR
+    ]
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "polling": coordinator.polling_diagnostics(),
+    }
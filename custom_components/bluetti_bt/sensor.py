@@ -11,7 +11,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import (
     CONF_ADDRESS,
-    CONF_NAME,
     EntityCategory,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -19,7 +18,6 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .bluetti_bt_lib.field_attributes import FIELD_ATTRIBUTES, PACK_FIELD_ATTRIBUTES, FieldType
-from .bluetti_bt_lib.utils.device_builder import build_device
 
 from . import device_info as dev_info, get_unique_id
 from .const import DATA_COORDINATOR, DOMAIN, DIAGNOSTIC_FIELDS
@@ -34,7 +32,6 @@ async def async_setup_entry(
 ) -> None:
     """Setup sensor entities."""
 
-    device_name = entry.data.get(CONF_NAME)
     address = entry.data.get(CONF_ADDRESS)
     if address is None:
         _LOGGER.error("Device has no address")
@@ -44,27 +41,32 @@ async def async_setup_entry(
     device_info = dev_info(entry)
 
     # Add sensors according to device_info
-    bluetti_device = build_device(address, device_name)
+    coordinator: PollingCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    bluetti_device = coordinator.bluetti_device
 
     sensors_to_add = []
-    all_fields = FIELD_ATTRIBUTES
+    all_fields = dict(FIELD_ATTRIBUTES)
+    pack_fields = set()
 
-    if len(bluetti_device.pack_polling_commands) > 0:
+    has_packs = len(bluetti_device.pack_polling_commands) > 0
+
+    if has_packs:
         # add pack fields for device
         _LOGGER.info("Device type(%s) pack_num_max(%s)", bluetti_device.type, bluetti_device.pack_num_max)
         for pack in range (1, bluetti_device.pack_num_max + 1):
             for name, field in PACK_FIELD_ATTRIBUTES(pack).items():
                 all_fields.update({name+str(pack): field})
+                pack_fields.add(name+str(pack))
 
     for field_key, field_config in all_fields.items():
-        if bluetti_device.has_field(field_key) or (len(bluetti_device.pack_polling_commands) > 0 and field_key.startswith("pack_")):
+        if bluetti_device.has_field(field_key) or (has_packs and field_key.startswith("pack_")):
             category = None
             if field_config.setter is True or field_key in DIAGNOSTIC_FIELDS:
                 category = EntityCategory.DIAGNOSTIC
             if field_config.type == FieldType.NUMERIC:
                 sensors_to_add.append(
                     BluettiSensor(
-                        hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR],
+                        coordinator,
                         device_info,
                         address,
                         field_key,
@@ -73,18 +75,20 @@ async def async_setup_entry(
                         field_config.device_class,
                         field_config.state_class,
                         category=category,
+                        is_pack_field=field_key in pack_fields,
                     )
                 )
             elif field_config.type == FieldType.ENUM and field_config.setter is False:
                 sensors_to_add.append(
                     BluettiSensor(
-                        hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR],
+                        coordinator,
                         device_info,
                         address,
                         field_key,
                         field_config.name,
                         options=[o.value for o in field_config.options],
                         category=category,
+                        is_pack_field=field_key in pack_fields,
                     )
                 )
 
@@ -106,9 +110,11 @@ class BluettiSensor(CoordinatorEntity, SensorEntity):
         state_class: str | None = None,
         category: EntityCategory | None = None,
         options: list[str] | None = None,
+        is_pack_field: bool = False,
     ):
         """Init battery entity."""
-        super().__init__(coordinator)
+        # Only updated when the value of response_key changed
+        super().__init__(coordinator, context=response_key)
 
         self._attr_has_entity_name = True
         e_name = f"{device_info.get('name')} {name}"
@@ -125,18 +131,19 @@ class BluettiSensor(CoordinatorEntity, SensorEntity):
         self._attr_state_class = state_class
         self._attr_entity_category = category
         self._options = options
+        self._is_pack_field = is_pack_field
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._attr_available
+        # Not available while the coordinator update failed
+        return super().available and self._attr_available
 
     def _set_available(self):
-        """Set sensor as available."""
+        """Set sensor as available, the state is written by the caller."""
         self._attr_available = True
         self._unavailable_counter = 0
         self._attr_extra_state_attributes = {}
-        self.async_write_ha_state()
 
     def _set_unavailable(self, cause: str = "Unknown"):
         """Set sensor as unavailable."""
@@ -156,10 +163,6 @@ class BluettiSensor(CoordinatorEntity, SensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        if self.coordinator.reader.persistent_conn and not self.coordinator.reader.client.is_connected:
-            self._set_unavailable("BLE disconnected")
-            return
-
         if self.coordinator.data is None:
             _LOGGER.debug(
                 "Data from coordinator is None",
@@ -181,15 +184,13 @@ class BluettiSensor(CoordinatorEntity, SensorEntity):
         response_data = self.coordinator.data.get(self._response_key)
         if response_data is None:
             _LOGGER.debug("No data for available for (%s)", self._response_key)
+            if self._is_pack_field and self._attr_available:
+                # Pack data expired, e.g. the pack was unplugged
+                self._attr_available = False
+                self.async_write_ha_state()
             return
 
-        if (
-            not isinstance(response_data, int)
-            and not isinstance(response_data, float)
-            and not isinstance(response_data, complex)
-            and not isinstance(response_data, Decimal)
-            and not isinstance(response_data, Enum)
-        ):
+        if not isinstance(response_data, (int, float, complex, Decimal, Enum)):
             _LOGGER.warning(
                 "Invalid response data type from coordinator (sensor.%s): %s has type %s",
                 unique_id_loggable(self._attr_unique_id),
@@ -14,7 +14,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.const import (
     CONF_ADDRESS,
-    CONF_NAME,
     EntityCategory,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -24,9 +23,9 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .bluetti_bt_lib.base_devices.BluettiDevice import BluettiDevice
+from .bluetti_bt_lib.bluetooth.connection_scheduler import PRIORITY_CONTROL
 from .bluetti_bt_lib.const import WRITE_UUID
 from .bluetti_bt_lib.field_attributes import FIELD_ATTRIBUTES, PACK_FIELD_ATTRIBUTES, FieldType
-from .bluetti_bt_lib.utils.device_builder import build_device
 
 from . import device_info as dev_info, get_unique_id
 from .const import CONTROL_FIELDS, DATA_COORDINATOR, DOMAIN
@@ -41,7 +40,6 @@ async def async_setup_entry(
 ) -> None:
     """Setup switch entities."""
 
-    device_name = entry.data.get(CONF_NAME)
     address = entry.data.get(CONF_ADDRESS)
     if address is None:
         _LOGGER.error("Device has no address")
@@ -51,7 +49,8 @@ async def async_setup_entry(
     device_info = dev_info(entry)
 
     # Add sensors according to device_info
-    bluetti_device = build_device(address, device_name)
+    coordinator: PollingCoordinator = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR]
+    bluetti_device = coordinator.bluetti_device
 
     sensors_to_add = []
     all_fields = FIELD_ATTRIBUTES
@@ -62,7 +61,7 @@ async def async_setup_entry(
                     sensors_to_add.append(
                         BluettiSwitch(
                             bluetti_device,
-                            hass.data[DOMAIN][entry.entry_id][DATA_COORDINATOR],
+                            coordinator,
                             device_info,
                             address,
                             field_key,
@@ -89,11 +88,11 @@ class BluettiSwitch(CoordinatorEntity, SwitchEntity):
         category: EntityCategory | None = None,
     ):
         """Init entity."""
-        super().__init__(coordinator)
+        # Only updated when the value of response_key changed
+        super().__init__(coordinator, context=response_key)
 
         self._bluetti_device = bluetti_device
         self._coordinator = coordinator
-        self._client = coordinator.reader.client
         self._polling_lock = coordinator.reader.polling_lock
         e_name = f"{device_info.get('name')} {name}"
         self._address = address
@@ -111,17 +110,13 @@ class BluettiSwitch(CoordinatorEntity, SwitchEntity):
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._attr_available
+        # Not available while the coordinator update failed
+        return super().available and self._attr_available
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
 
-        if self.coordinator.reader.persistent_conn and not self.coordinator.reader.client.is_connected:
-            self._attr_available = False
-            self.async_write_ha_state()
-            return
-
         _LOGGER.debug("Updating state of %s", unique_id_loggable(self._attr_unique_id))
         if not isinstance(self.coordinator.data, dict):
             _LOGGER.debug(
@@ -164,15 +159,20 @@ class BluettiSwitch(CoordinatorEntity, SwitchEntity):
         """Write to device."""
         command = self._bluetti_device.build_setter_command(self._response_key, state)
 
+        reader = self._coordinator.reader
         async with self._polling_lock:
             try:
                 async with async_timeout.timeout(15):
-                    if not self._client.is_connected:
-                        await self._client.connect()
+                    # Control writes are served before queued polls
+                    await reader.acquire_slot(PRIORITY_CONTROL)
+
+                    # The reader replaces its client on every reconnect
+                    if not reader.client.is_connected:
+                        await reader.client.connect()
 
                     # Send command
                     _LOGGER.debug("Requesting %s (%s,%s)", command, self._response_key, state)
-                    await self._client.write_gatt_char(
+                    await reader.client.write_gatt_char(
                         WRITE_UUID, bytes(command)
                     )
 
@@ -187,7 +187,8 @@ class BluettiSwitch(CoordinatorEntity, SwitchEntity):
                 return None
             finally:
                 # Disconnect if connection not persistant
-                if not self._coordinator.reader.persistent_conn:
-                    await self._client.disconnect()
+                if not reader.persistent_conn and reader.linger_time <= 0:
+                    await reader.client.disconnect()
+                reader.release_slot()
 
         await self.coordinator.async_request_refresh()
@@ -0,0 +1,27 @@
+"""Unittest for MODBUS commands."""
+
+import unittest
+
+from custom_components.bluetti_bt.bluetti_bt_lib.utils.commands import (
+    ReadHoldingRegisters,
+    WriteSingleRegister,
+)
+
+
+class TestCommands(unittest.TestCase):
+    def test_matching_response(self):
+        command = ReadHoldingRegisters(100, 4)
+
+        self.assertTrue(command.is_matching_response(bytes([1, 3, 8]) + bytes(10)))
+        # Response to a read of another size
+        self.assertFalse(command.is_matching_response(bytes([1, 3, 6]) + bytes(8)))
+        # Response to a write
+        self.assertFalse(command.is_matching_response(bytes([1, 6, 8]) + bytes(10)))
+
+        write = WriteSingleRegister(3007, 1)
+        self.assertTrue(write.is_matching_response(bytes(write)))
+        self.assertFalse(write.is_matching_response(bytes(command)))
+
+
+if __name__ == "__main__":
+    unittest.main()
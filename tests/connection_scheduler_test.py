@@ -0,0 +1,119 @@
+"""Unittest for the connection slot scheduler."""
+
+import asyncio
+import unittest
+
+from custom_components.bluetti_bt.bluetti_bt_lib.bluetooth.connection_scheduler import (
+    PRIORITY_CONTROL,
+    PRIORITY_POLL,
+    ConnectionScheduler,
+)
+from custom_components.bluetti_bt.bluetti_bt_lib.bluetooth.device_reader import (
+    DeviceReader,
+)
+from custom_components.bluetti_bt.bluetti_bt_lib.utils.device_builder import (
+    build_device,
+)
+
+
+class ConnectedClient:
+    """Connection which stays open, like a persistent one"""
+
+    is_connected = True
+
+    async def start_notify(self, uuid, handler):
+        pass
+
+    async def stop_notify(self, uuid):
+        pass
+
+    async def disconnect(self):
+        pass
+
+
+class TestConnectionScheduler(unittest.IsolatedAsyncioTestCase):
+    async def test_slots_per_adapter(self):
+        scheduler = ConnectionScheduler(max_connections=1, stagger=0)
+        await scheduler.acquire("hci0", "a")
+        # Other adapters have their own slots
+        await asyncio.wait_for(scheduler.acquire("proxy", "b"), 1)
+
+        waiter = asyncio.create_task(scheduler.acquire("hci0", "c"))
+        await asyncio.sleep(0.01)
+        self.assertFalse(waiter.done())
+
+        scheduler.release("hci0")
+        await asyncio.wait_for(waiter, 1)
+        self.assertEqual(scheduler.diagnostics("c")["waits"], 1)
+        self.assertEqual(scheduler.diagnostics("d")["waits"], 0)
+
+    async def test_control_first(self):
+        scheduler = ConnectionScheduler(max_connections=1, stagger=0)
+        await scheduler.acquire("hci0", "a")
+        order = []
+
+        async def acquire(device, priority):
+            await scheduler.acquire("hci0", device, priority)
+            order.append(device)
+            scheduler.release("hci0")
+
+        poll = asyncio.create_task(acquire("poll", PRIORITY_POLL))
+        await asyncio.sleep(0)
+        control = asyncio.create_task(acquire("control", PRIORITY_CONTROL))
+        await asyncio.sleep(0)
+
+        scheduler.release("hci0")
+        await asyncio.wait_for(asyncio.gather(poll, control), 1)
+        self.assertEqual(order, ["control", "poll"])
+
+    async def test_cancelled_waiter(self):
+        scheduler = ConnectionScheduler(max_connections=1, stagger=0)
+        await scheduler.acquire("hci0", "a")
+        waiter = asyncio.create_task(scheduler.acquire("hci0", "b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+
+        # The slot isn't handed to the cancelled waiter
+        scheduler.release("hci0")
+        await asyncio.wait_for(scheduler.acquire("hci0", "c"), 1)
+
+    async def test_stagger(self):
+        scheduler = ConnectionScheduler(max_connections=2, stagger=0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await scheduler.acquire("hci0", "a")
+        await scheduler.acquire("hci0", "b")
+        self.assertGreaterEqual(loop.time() - start, 0.04)
+
+    async def test_persistent_devices(self):
+        scheduler = ConnectionScheduler(max_connections=2, stagger=0)
+        loop = asyncio.get_running_loop()
+        readers = []
+        for i in range(4):
+            reader = DeviceReader(
+                ConnectedClient(),
+                build_device(f"aa:bb:cc:dd:ee:0{i}", "EP760123"),
+                loop.create_future,
+                persistent_conn=True,
+                polling_timeout=1,
+                scheduler=scheduler,
+            )
+            reader.set_demand(set())
+            readers.append(reader)
+
+        # More persistent devices than slots still poll, again and again
+        for _ in range(2):
+            await asyncio.wait_for(
+                asyncio.gather(*(r.read_data() for r in readers)), 1
+            )
+        for reader in readers:
+            self.assertIsNone(reader.slot_adapter)
+            self.assertEqual(
+                scheduler.diagnostics(reader.bluetti_device.address)["waits"], 2
+            )
+        self.assertEqual(scheduler.adapters["default"].active, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
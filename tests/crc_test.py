@@ -0,0 +1,23 @@
+"""Unittest for MODBUS crc."""
+
+import unittest
+
+from custom_components.bluetti_bt.bluetti_bt_lib.utils import crc
+
+
+class TestCrc(unittest.TestCase):
+    def test_check_value(self):
+        for fun in (crc.modbus_crc, crc._crc_words, crc._crc_bytes):
+            self.assertEqual(fun(b"123456789"), 0x4B37)
+
+    def test_incremental(self):
+        data = bytearray(range(205))
+        view = memoryview(data)
+
+        for fun in (crc.modbus_crc, crc._crc_words, crc._crc_bytes):
+            self.assertEqual(fun(view[101:], fun(view[:101])), fun(data))
+
+    def test_request_frame(self):
+        # ReadHoldingRegisters(110, 6)
+        frame = bytes.fromhex("0103006e0006")
+        self.assertEqual(crc.modbus_crc(frame).to_bytes(2, "little"), bytes.fromhex("a415"))
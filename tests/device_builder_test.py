@@ -2,7 +2,8 @@
 
 import unittest
 
-from custom_components.bluetti_bt.bluetti_bt_lib.utils.device_builder import build_device
+from custom_components.bluetti_bt.bluetti_bt_lib.utils.device_builder import build_device, get_device, remove_device
+from custom_components.bluetti_bt.bluetti_bt_lib.field_enums import PollingTier
 from custom_components.bluetti_bt.bluetti_bt_lib.devices.ac2a import AC2A
 from custom_components.bluetti_bt.bluetti_bt_lib.devices.ac2p import AC2P
 from custom_components.bluetti_bt.bluetti_bt_lib.devices.ac60 import AC60
@@ -94,10 +95,76 @@ class TestDeviceBuilder(unittest.TestCase):
         self._test_device_build("EP76056786746478", EP760)
 
     def test_build_EP800(self):
-		self._test_device_build("EP80056786746478", EP800)
+        self._test_device_build("EP80056786746478", EP800)
 
     def test_build_Eite200V2(self):
-    	self._test_device_build("E200V256786746478", Elite200V2)
+        self._test_device_build("E200V256786746478", Elite200V2)
+
+    def test_get_device_shared(self):
+        bt_addr = "aa:bb:cc:dd:ee:ff"
+        device = get_device(bt_addr, "EP76056786746478")
+
+        self.assertIsInstance(device, EP760)
+        self.assertIs(get_device(bt_addr, "EP76056786746478"), device)
+        self.assertIsNot(get_device("11:22:33:44:55:66", "EP76056786746478"), device)
+
+        # Unloaded entries don't keep their device model
+        remove_device(bt_addr, "EP76056786746478")
+        self.assertIsNot(get_device(bt_addr, "EP76056786746478"), device)
+
+    def test_field_index(self):
+        device = build_device("aa:bb:cc:dd:ee:ff", "AC180P56786746478")
+
+        self.assertTrue(device.has_field("ac_output_power"))
+        self.assertFalse(device.has_field("unknown_field"))
+        self.assertTrue(device.has_field_setter("ac_output_on_switch"))
+        self.assertFalse(device.has_field_setter("ac_output_power"))
+
+        command = device.build_setter_command("ac_output_on_switch", True)
+        self.assertEqual(command.address, 2011)
+        self.assertEqual(command.value, 1)
+
+    def test_polling_tiers(self):
+        device = build_device("aa:bb:cc:dd:ee:ff", "AC30056786746478")
+
+        def addresses(commands):
+            return {
+                a
+                for c in commands
+                for a in range(c.starting_address, c.starting_address + c.quantity)
+            }
+
+        fast = addresses(device.get_polling_commands([PollingTier.FAST]))
+        static = addresses(device.get_polling_commands([PollingTier.STATIC]))
+        slow = addresses(device.get_polling_commands([PollingTier.SLOW]))
+
+        self.assertIn(36, fast)  # dc_input_power
+        self.assertNotIn(17, fast)  # serial_number
+        self.assertIn(17, static)
+        self.assertIn(3001, slow)  # ups_mode
+        self.assertNotIn(96, fast | static | slow)  # pack_num_result
+        for field in device.struct.fields:
+            if device.is_polled_address(field.address):
+                self.assertIn(field.address, fast | static | slow)
+
+    def test_polling_names(self):
+        device = build_device("aa:bb:cc:dd:ee:ff", "EP760123")
+
+        all_registers = sum(c.quantity for c in device.get_polling_commands())
+        commands = device.get_polling_commands(
+            names={"total_battery_percent", "pv_input_power_all"}
+        )
+        addresses = {
+            a
+            for c in commands
+            for a in range(c.starting_address, c.starting_address + c.quantity)
+        }
+
+        for name in ("total_battery_percent", "pv_input_power_all"):
+            for field in device.struct.fields_by_name[name]:
+                self.assertIn(field.address, addresses)
+        self.assertLess(len(addresses), all_registers)
+        self.assertEqual(device.get_polling_commands(names=set()), [])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,132 @@
+"""Unittest for the device reader."""
+
+import asyncio
+import struct
+import unittest
+from unittest.mock import patch
+
+from custom_components.bluetti_bt.bluetti_bt_lib.bluetooth.device_reader import (
+    DeviceReader,
+)
+from custom_components.bluetti_bt.bluetti_bt_lib.utils.crc import modbus_crc
+from custom_components.bluetti_bt.bluetti_bt_lib.utils.device_builder import (
+    build_device,
+)
+
+
+class DisconnectedClient:
+    """Device out of range, connecting fails"""
+
+    is_connected = False
+
+    async def disconnect(self):
+        pass
+
+
+class PackClient:
+    """AC300 with battery packs, packs in empty_slots can't be selected"""
+
+    is_connected = True
+
+    def __init__(self, empty_slots=()):
+        self.empty_slots = set(empty_slots)
+        self.selected = 0
+        self.selects = []
+        self.handler = None
+
+    async def start_notify(self, uuid, handler):
+        self.handler = handler
+
+    async def stop_notify(self, uuid):
+        pass
+
+    async def disconnect(self):
+        pass
+
+    def register(self, address: int) -> int:
+        if address == 96:
+            return self.selected  # pack_num_result
+        if address == 99:
+            return 70 + self.selected  # pack_battery_percent
+        if address in (201, 202):
+            return 1  # pack_bms_version
+        return 0
+
+    async def write_gatt_char(self, uuid, data):
+        function_code, address, value = struct.unpack(">xBHH", data[:6])
+        if function_code == 3:
+            body = bytes([1, 3, 2 * value]) + b"".join(
+                struct.pack(">H", self.register(a)) for a in range(address, address + value)
+            )
+        else:
+            self.selects.append(value)
+            if value not in self.empty_slots:
+                self.selected = value
+            body = bytes(data[:6])
+        frame = body + struct.pack("<H", modbus_crc(body))
+        asyncio.get_running_loop().call_soon(
+            asyncio.ensure_future, self.handler(0, bytearray(frame))
+        )
+
+
+class TestDeviceReader(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_read_with_cached_packs(self):
+        reader = DeviceReader(
+            DisconnectedClient(),
+            build_device("aa:bb:cc:dd:ee:ff", "AC3001"),
+            asyncio.get_running_loop().create_future,
+            max_retries=1,
+            pack_polling_interval=60,
+        )
+        reader.packs.update(1, {"pack_voltage": 52})
+
+        # Cached pack data doesn't make a failed poll successful
+        self.assertIsNone(await reader.read_data())
+        self.assertEqual(reader.packs.flatten({}), {"pack_voltage1": 52})
+
+    async def test_lost_persistent_connection(self):
+        reader = DeviceReader(
+            DisconnectedClient(),
+            build_device("aa:bb:cc:dd:ee:ff", "EP760123"),
+            asyncio.get_running_loop().create_future,
+            persistent_conn=True,
+            max_retries=1,
+        )
+        reader.has_notifier = True
+
+        # A link which can't be connected again is a failed poll, the
+        # entities count it like any other failed poll
+        self.assertIsNone(await reader.read_data())
+        self.assertFalse(reader.has_notifier)
+
+    async def test_pack_select_retries(self):
+        client = PackClient(empty_slots=[2])
+        reader = DeviceReader(
+            client,
+            build_device("aa:bb:cc:dd:ee:ff", "AC3001"),
+            asyncio.get_running_loop().create_future,
+        )
+        await reader._async_connect()
+
+        with patch(
+            "custom_components.bluetti_bt.bluetti_bt_lib.bluetooth.device_reader.PACK_SELECT_DELAY",
+            0,
+        ):
+            self.assertTrue(await reader._async_scan_packs(reader.pack_commands))
+
+        # Pack 3 is selected after the reads of pack 2, the retries of pack 2
+        # don't select it again, only once they are done
+        self.assertEqual(client.selects, [1, 2, 3, 2, 2, 3, 4])
+        self.assertEqual(list(reader.pack_failed_at), [2])
+        self.assertEqual(
+            {k: v for k, v in reader.packs.flatten({}).items() if "percent" in k},
+            {
+                "pack_battery_percent1": 71,
+                "pack_battery_percent3": 73,
+                "pack_battery_percent4": 74,
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
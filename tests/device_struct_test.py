@@ -1,6 +1,7 @@
 """Unittest for device struct."""
 
 import unittest
+from decimal import Decimal
 
 from custom_components.bluetti_bt.bluetti_bt_lib.utils.commands import ReadHoldingRegisters
 from custom_components.bluetti_bt.bluetti_bt_lib.utils.struct import DeviceStruct
@@ -22,3 +23,92 @@ class TestDeviceStruct(unittest.TestCase):
 
         for reg in registers:
             self.assertIsInstance(reg, ReadHoldingRegisters)
+
+    def test_get_read_holding_registers_merges_small_gaps(self):
+        struct = DeviceStruct()
+
+        struct.add_uint_field("dc_output_power", 140)
+        struct.add_uint_field("ac_output_power", 142)
+        struct.add_uint_field("dc_input_power", 144)
+        struct.add_uint_field("ac_input_power", 146)
+
+        registers = struct.get_read_holding_registers()
+
+        self.assertEqual(len(registers), 1)
+        self.assertEqual(registers[0].starting_address, 140)
+        self.assertEqual(registers[0].quantity, 7)
+
+    def test_get_read_holding_registers_splits_large_gaps(self):
+        struct = DeviceStruct()
+
+        struct.add_uint_field("dc_output_power", 140)
+        struct.add_decimal_field("ac_input_voltage", 1314, 1)
+
+        registers = struct.get_read_holding_registers()
+
+        self.assertEqual(
+            [(r.starting_address, r.quantity) for r in registers],
+            [(140, 1), (1314, 1)],
+        )
+
+    def test_get_read_holding_registers_max_registers(self):
+        struct = DeviceStruct()
+
+        struct.add_swap_string_field("device_type", 110, 6)
+        struct.add_sn_field("serial_number", 116)
+        struct.add_uint_field("dc_output_power", 120)
+
+        registers = struct.get_read_holding_registers(max_registers=8)
+
+        for reg in registers:
+            self.assertLessEqual(reg.quantity, 8)
+
+        # Fields are never split across reads
+        self.assertEqual(
+            [(r.starting_address, r.quantity) for r in registers],
+            [(110, 6), (116, 5)],
+        )
+
+    def test_parse(self):
+        struct = DeviceStruct()
+
+        struct.add_uint_field("dc_output_power", 140)
+        struct.add_int_field("ac_output_power", 142)
+        struct.add_bool_field("ac_output_on", 143)
+        struct.add_decimal_field("ac_input_voltage", 144, 1)
+        struct.add_version_field("arm_version", 145)
+
+        data = bytes.fromhex("0064 0000 ffff 0001 0960 2710 0000")
+        parsed = struct.parse(140, data)
+
+        self.assertEqual(parsed["dc_output_power"], 100)
+        self.assertEqual(parsed["ac_output_power"], -1)
+        self.assertEqual(parsed["ac_output_on"], True)
+        self.assertEqual(parsed["ac_input_voltage"], Decimal("240.0"))
+        self.assertEqual(parsed["arm_version"], Decimal("100"))
+
+        # Parse plan is reused and dropped when fields are added
+        self.assertEqual(struct.parse(140, data), parsed)
+        struct.add_uint_field("dc_input_power", 141)
+        self.assertEqual(struct.parse(140, data)["dc_input_power"], 0)
+
+    def test_parse_batch(self):
+        struct = DeviceStruct()
+
+        struct.add_uint_field("dc_output_power", 140)
+        struct.add_int_field("ac_output_power", 142)
+        struct.add_decimal_field("ac_input_voltage", 144, 1, (0, 300))
+
+        responses = [
+            bytes.fromhex("0064 0000 ffff 0000 0960"),
+            bytes.fromhex("00c8 0000 0005 0000 ffff"),
+        ]
+        columns = struct.parse_batch(140, responses)
+
+        self.assertEqual(list(columns["dc_output_power"]), [100, 200])
+        self.assertEqual(list(columns["ac_output_power"]), [-1, 5])
+        self.assertAlmostEqual(columns["ac_input_voltage"][0], 240.0)
+
+        # Out of range values are masked like parse() skips them
+        self.assertNotIn("ac_input_voltage", struct.parse(140, responses[1]))
+        self.assertTrue(columns["ac_input_voltage"].mask[1])
@@ -0,0 +1,39 @@
+"""Unittest for battery pack snapshots."""
+
+import unittest
+
+from custom_components.bluetti_bt.bluetti_bt_lib.utils.packs import PackSnapshots
+
+
+class TestPackSnapshots(unittest.TestCase):
+    def test_flatten(self):
+        packs = PackSnapshots(ttl=60)
+        packs.update(1, {"pack_voltage": 52.1, "pack_battery_percent": 80}, now=0)
+        packs.update(2, {"pack_voltage": 51.9}, now=0)
+        packs.update(2, {"pack_battery_percent": 75}, now=10)
+
+        self.assertEqual(
+            packs.flatten({"total_battery_percent": 78}, now=10),
+            {
+                "total_battery_percent": 78,
+                "pack_voltage1": 52.1,
+                "pack_battery_percent1": 80,
+                "pack_voltage2": 51.9,
+                "pack_battery_percent2": 75,
+            },
+        )
+        self.assertEqual(packs.updated_at(2), 10)
+        self.assertIsNone(packs.updated_at(3))
+
+    def test_expire(self):
+        packs = PackSnapshots(ttl=60)
+        packs.update(1, {"pack_voltage": 52.1}, now=0)
+        packs.update(2, {"pack_voltage": 51.9}, now=30)
+
+        self.assertEqual(packs.flatten({}, now=61), {"pack_voltage2": 51.9})
+        self.assertIsNone(packs.updated_at(1))
+        self.assertEqual(packs.flatten({}, now=91), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
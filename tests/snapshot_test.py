@@ -0,0 +1,33 @@
+"""Unittest for the last known good snapshot."""
+
+import unittest
+
+from custom_components.bluetti_bt.bluetti_bt_lib.utils.snapshot import DataSnapshot
+
+
+class TestDataSnapshot(unittest.TestCase):
+    def test_fresh(self):
+        snapshot = DataSnapshot(ttl=60)
+        snapshot.update({"ac_output_power": 100, "dc_output_power": 20}, now=0)
+        snapshot.update({"ac_output_power": 150}, now=30)
+
+        self.assertEqual(
+            snapshot.fresh(now=30), {"ac_output_power": 150, "dc_output_power": 20}
+        )
+        self.assertEqual(
+            snapshot.ages(now=40), {"ac_output_power": 10, "dc_output_power": 40}
+        )
+        self.assertEqual(snapshot.fresh(now=61), {"ac_output_power": 150})
+        self.assertEqual(snapshot.ages(now=61), {"ac_output_power": 31})
+
+    def test_no_ttl(self):
+        snapshot = DataSnapshot(ttl=0)
+        snapshot.update({"ac_output_power": 100, "dc_output_power": 20}, now=0)
+        snapshot.update({"ac_output_power": 150}, now=20)
+
+        # Only values of the last poll
+        self.assertEqual(snapshot.fresh(now=20), {"ac_output_power": 150})
+
+
+if __name__ == "__main__":
+    unittest.main()